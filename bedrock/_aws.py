@@ -0,0 +1,108 @@
+"""
+Shared boto3 session and client cache for the bedrock deploy scripts; every
+script builds its clients here, so retry and pool settings live in one place
+
+boto3 is imported on the first client() call, so scripts that exit early
+(bad arguments, nothing to upload) never pay for loading it.
+"""
+import base64
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+
+_REGION = 'us-east-1'
+
+# Keep-alive so the list -> delete -> create -> prepare chain reuses one
+# TLS connection instead of handshaking on every call; adaptive retries
+# back off under throttling and a short connect timeout fails fast
+_CLIENT_CONFIG = dict(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    max_pool_connections=64,
+    connect_timeout=3,
+    read_timeout=30
+)
+
+# Clients by (service, region). boto3 sessions are not thread-safe, so the
+# session and its clients are only built under _CLIENT_LOCK
+_SESSION = None
+_CLIENTS = {}
+_CLIENT_LOCK = threading.Lock()
+
+def client(service, region=None):
+    """Return a boto3 client, built once per (service, region); region defaults to us-east-1.
+    
+    The one shared session means the credential chain is walked once per
+    process rather than once per client. Safe to call from several threads.
+    """
+    global _SESSION
+    key = (service, region or _REGION)
+    result = _CLIENTS.get(key)
+    if result is None:
+        with _CLIENT_LOCK:
+            result = _CLIENTS.get(key)
+            if result is None:
+                import boto3
+                from botocore.config import Config
+                if _SESSION is None:
+                    _SESSION = boto3.session.Session(region_name=_REGION)
+                result = _CLIENTS[key] = _SESSION.client(
+                    service, region_name=key[1], config=Config(**_CLIENT_CONFIG)
+                )
+    return result
+
+def update_function_code(function_name, source_path, s3_key):
+    """Package a single-file Lambda source and upload it unless the function already runs it.
+    
+    The source becomes lambda_function.py in the zip. The upload goes through
+    S3 under s3_key when LAMBDA_ARTIFACT_BUCKET is set, and inline otherwise.
+    Returns True if new code was uploaded, False if CodeSha256 already matched.
+    """
+    import zipfile
+    
+    # Build the zip in memory; fastest compression, the package is a single small file.
+    # A fixed timestamp keeps the bytes, and so CodeSha256, stable for unchanged source
+    buf = io.BytesIO()
+    info = zipfile.ZipInfo('lambda_function.py', date_time=(1980, 1, 1, 0, 0, 0))
+    info.external_attr = 0o644 << 16
+    with zipfile.ZipFile(buf, 'w') as zipf:
+        zipf.writestr(info, Path(source_path).read_bytes(),
+                      compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+    zip_bytes = buf.getvalue()
+    
+    print(f"✅ Created deployment package ({len(zip_bytes)} bytes)")
+    
+    lambda_client = client('lambda')
+    
+    local_sha = base64.b64encode(hashlib.sha256(zip_bytes).digest()).decode()
+    current = lambda_client.get_function_configuration(FunctionName=function_name)
+    if current['CodeSha256'] == local_sha:
+        print(f"✅ No change; skipping upload (Code SHA256: {local_sha})")
+        return False
+    
+    # Stage through S3 when a bucket is configured, so large packages go up
+    # through the multipart uploader instead of inline in the API request
+    bucket = os.environ.get('LAMBDA_ARTIFACT_BUCKET')
+    if bucket:
+        from boto3.s3.transfer import TransferConfig
+        client('s3').upload_fileobj(
+            io.BytesIO(zip_bytes), bucket, s3_key,
+            Config=TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=10)
+        )
+        response = lambda_client.update_function_code(
+            FunctionName=function_name,
+            S3Bucket=bucket,
+            S3Key=s3_key
+        )
+    else:
+        response = lambda_client.update_function_code(
+            FunctionName=function_name,
+            ZipFile=zip_bytes
+        )
+    
+    print(f"✅ Updated Lambda function: {response['FunctionName']}")
+    print(f"   Last Modified: {response['LastModified']}")
+    print(f"   Code SHA256: {response['CodeSha256']}")
+    return True
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Deploy an OpenAPI action group onto the existing security Bedrock Agent
+
+The deploy_agent_{clean,fixed,minimal,simple}.py scripts are thin wrappers
+around deploy(), one per schema in SCHEMAS. Running several of them from one
+process shares the boto3 session and clients in _aws.py.
+
+Usage: python deploy_action_group.py [clean|fixed|minimal|simple]
+"""
+import functools
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from _aws import client
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj):
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+AGENT_ID = "KS91Z9H2MA"
+LAMBDA_ARN = "arn:aws:lambda:us-east-1:039920874011:function:security-agent-bridge"
+
+# One OpenAPI schema file per variant: clean (query parameters), fixed
+# (JSON request bodies), minimal (single operation) and simple
+_SCHEMA_DIR = Path(__file__).resolve().parent / 'schemas'
+
+# Compact payloads, serialized once at import; the parsed schemas are not kept
+SCHEMAS = MappingProxyType({
+    name: _dumps(json.loads((_SCHEMA_DIR / f'action_group_{name}.json').read_text()))
+    for name in ('clean', 'fixed', 'minimal', 'simple')
+})
+
+@functools.lru_cache(maxsize=8)
+def _list_action_groups(agent_id, agent_version):
+    """Return the agent's action groups as (id, name) pairs, listed once per run"""
+    response = client('bedrock-agent').list_agent_action_groups(
+        agentId=agent_id,
+        agentVersion=agent_version
+    )
+    return tuple(
+        (ag['actionGroupId'], ag['actionGroupName'])
+        for ag in response['actionGroupSummaries']
+    )
+
+def _delete_action_groups(bedrock_client, action_group_ids):
+    """Delete the given action groups from the agent's DRAFT version"""
+    def delete_action_group(action_group_id):
+        bedrock_client.delete_agent_action_group(
+            agentId=AGENT_ID,
+            agentVersion='DRAFT',
+            actionGroupId=action_group_id
+        )
+        return action_group_id
+    
+    # Deletes are independent, so issue them at once; 16 workers stays well
+    # inside the client's connection pool so threads never queue for a socket
+    try:
+        with ThreadPoolExecutor(max_workers=min(16, len(action_group_ids)) or 1) as executor:
+            for action_group_id in executor.map(delete_action_group, action_group_ids):
+                print(f"Deleted existing action group: {action_group_id}")
+    finally:
+        _list_action_groups.cache_clear()
+
+def _wait_for_prepared(bedrock_client, agent_id):
+    """Poll get_agent with backoff until the agent finishes preparing"""
+    delay = 0.5
+    for _ in range(30):
+        status = bedrock_client.get_agent(agentId=agent_id)['agent']['agentStatus']
+        if status == 'PREPARED':
+            return
+        if status == 'FAILED':
+            raise RuntimeError(f"Agent {agent_id} failed to prepare")
+        time.sleep(delay)
+        delay = min(delay * 1.6, 5.0)
+    raise TimeoutError(f"Agent {agent_id} is still {status}")
+
+def prepare_agent():
+    """Prepare the agent's DRAFT version and wait until it reaches PREPARED"""
+    bedrock_client = client('bedrock-agent')
+    prepare_response = bedrock_client.prepare_agent(
+        agentId=AGENT_ID
+    )
+    print(f"Agent preparing: {prepare_response['agentStatus']}")
+    _wait_for_prepared(bedrock_client, AGENT_ID)
+    print("Agent prepared successfully: PREPARED")
+
+def deploy(schema_name, action_group_name='security-tools',
+           description='AWS Security Assessment Tools', delete_existing=False, prepare=True):
+    """Create the action group from SCHEMAS[schema_name] and prepare the agent.
+    
+    An action group that already exists under the same name is left in place,
+    unless delete_existing is set, which first removes every action group on
+    the agent. Returns the agent id, or None if the action group step failed.
+    """
+    bedrock_client = client('bedrock-agent')
+    print(f"Using existing Bedrock Agent: {AGENT_ID}")
+    
+    try:
+        action_groups = _list_action_groups(AGENT_ID, 'DRAFT')
+        
+        existing_action_group = None
+        if delete_existing:
+            _delete_action_groups(bedrock_client, [ag_id for ag_id, _ in action_groups])
+        else:
+            for ag_id, ag_name in action_groups:
+                if ag_name == action_group_name:
+                    existing_action_group = ag_id
+                    print(f"Found existing action group: {existing_action_group}")
+                    break
+        
+        if existing_action_group:
+            print("Action group already exists, skipping creation")
+        else:
+            action_group_response = bedrock_client.create_agent_action_group(
+                agentId=AGENT_ID,
+                agentVersion='DRAFT',
+                actionGroupName=action_group_name,
+                description=description,
+                actionGroupExecutor={
+                    'lambda': LAMBDA_ARN
+                },
+                apiSchema={
+                    'payload': SCHEMAS[schema_name]
+                }
+            )
+            _list_action_groups.cache_clear()
+            print(f"Created Action Group: {action_group_response['agentActionGroup']['actionGroupId']}")
+        
+    except Exception as e:
+        print(f"Error with action group: {e}")
+        return None
+    
+    if prepare:
+        try:
+            prepare_agent()
+        except Exception as e:
+            print(f"Error preparing agent: {e}")
+    
+    return AGENT_ID
+
+if __name__ == "__main__":
+    schema_name = sys.argv[1] if len(sys.argv) > 1 else 'clean'
+    if schema_name not in SCHEMAS:
+        sys.exit(f"Unknown schema {schema_name!r}, expected one of: {', '.join(SCHEMAS)}")
+    agent_id = deploy(schema_name)
+    if agent_id:
+        print(f"\n✅ Bedrock Agent configured successfully!")
+        print(f"Agent ID: {agent_id}")
+    else:
+        print(f"\n❌ Bedrock Agent configuration failed!")
@@ -1,15 +1,191 @@
 #!/usr/bin/env python3
-import boto3
+import hashlib
 import json
+import logging
+import os
 import time
+from botocore.exceptions import ClientError, WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from _aws import client
 
-def create_bedrock_agent():
-    """Deploy Bedrock Agent with security tools"""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+def _dumps(obj):
+    """Serialize to compact JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+_ACCOUNT_ID = os.environ.get('AWS_ACCOUNT_ID', '039920874011')
+_LAMBDA_ARN = f"arn:aws:lambda:{_REGION}:{_ACCOUNT_ID}:function:security-agent-bridge"
+
+# OpenAPI schema for the security-tools action group, compacted once at import
+_API_SCHEMA_FILE = Path(__file__).resolve().parent / 'schemas' / 'security_tools.json'
+_API_SCHEMA_PAYLOAD = _dumps(json.loads(_API_SCHEMA_FILE.read_text()))
+
+_AGENT_INSTRUCTION = """You are an AWS Security Assessment Agent. You help users analyze their AWS infrastructure security posture using comprehensive security tools.
+
+Your capabilities include:
+- Checking security service configurations across AWS accounts
+- Analyzing security findings from AWS Security Hub, GuardDuty, and other services  
+- Evaluating resource compliance against security best practices
+- Exploring AWS resources and their security configurations
+- Providing detailed security posture analysis and recommendations
+
+Always provide clear, actionable security recommendations and explain the security implications of your findings."""
+
+_AGENT_ROLE_ARN = f"arn:aws:iam::{_ACCOUNT_ID}:role/SecurityBedrockAgentRole"
+
+# Tagged on the agent after a successful deploy. It covers everything this
+# script configures; a matching tag on a PREPARED agent whose live action
+# group still matches means there is nothing to redeploy
+_SCHEMA_HASH = hashlib.blake2b(
+    '\0'.join((_API_SCHEMA_PAYLOAD, _AGENT_INSTRUCTION, _LAMBDA_ARN, _AGENT_ROLE_ARN)).encode(),
+    digest_size=8
+).hexdigest()
+
+# Error codes meaning the resource is already in the desired state
+_ALREADY_EXISTS_CODES = ('EntityAlreadyExists', 'ResourceConflictException')
+
+# Polls get_agent every 5 s for up to 5 minutes until the agent settles
+_AGENT_WAITER_MODEL = WaiterModel({
+    'version': 2,
+    'waiters': {
+        'AgentReady': {
+            'operation': 'GetAgent',
+            'delay': 5,
+            'maxAttempts': 60,
+            'acceptors': [
+                {'state': 'success', 'matcher': 'path', 'argument': 'agent.agentStatus', 'expected': 'PREPARED'},
+                {'state': 'success', 'matcher': 'path', 'argument': 'agent.agentStatus', 'expected': 'NOT_PREPARED'},
+                {'state': 'failure', 'matcher': 'path', 'argument': 'agent.agentStatus', 'expected': 'FAILED'},
+                {'state': 'retry', 'matcher': 'error', 'expected': 'ResourceNotFoundException'}
+            ]
+        }
+    }
+})
+
+# Resolved agent id, so re-deploys can skip listing every agent in the account
+_AGENT_CACHE_FILE = Path.home() / '.cache' / 'security-agent' / 'agent.json'
+
+def _load_cached_agent_id():
+    """Return the agent id saved by a previous deploy, if any"""
+    try:
+        with open(_AGENT_CACHE_FILE) as f:
+            return json.load(f).get('agent_id')
+    except (OSError, ValueError):
+        return None
+
+def _save_cached_agent_id(agent_id):
+    """Remember the agent id for the next deploy"""
+    try:
+        _AGENT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_AGENT_CACHE_FILE, 'w') as f:
+            json.dump({'agent_id': agent_id}, f)
+    except OSError as e:
+        logger.warning("Could not cache agent id: %s", e)
+
+def _find_agent_id(bedrock_client):
+    """Look up the security-assessment-agent id across all pages of list_agents"""
+    paginator = bedrock_client.get_paginator('list_agents')
+    for page in paginator.paginate():
+        for agent in page['agentSummaries']:
+            if agent['agentName'] == 'security-assessment-agent':
+                logger.info("Found existing Bedrock Agent: %s", agent['agentId'])
+                return agent['agentId']
+    return None
+
+def _agent_arn(agent_id):
+    """Return the ARN of a Bedrock agent in the deploy account and region"""
+    return f"arn:aws:bedrock:{_REGION}:{_ACCOUNT_ID}:agent/{agent_id}"
+
+def _action_group_matches(bedrock_client, agent_id):
+    """Check that the agent's live security-tools action group is the one this script deploys.
+    
+    Other scripts (deploy_action_group.py) rewrite the action groups without
+    touching the schema-hash tag, so the tag alone is not enough.
+    """
+    action_groups = bedrock_client.list_agent_action_groups(
+        agentId=agent_id,
+        agentVersion='DRAFT'
+    )['actionGroupSummaries']
+    for ag in action_groups:
+        if ag['actionGroupName'] == 'security-tools':
+            action_group = bedrock_client.get_agent_action_group(
+                agentId=agent_id,
+                agentVersion='DRAFT',
+                actionGroupId=ag['actionGroupId']
+            )['agentActionGroup']
+            payload = action_group.get('apiSchema', {}).get('payload')
+            return (
+                action_group.get('actionGroupExecutor', {}).get('lambda') == _LAMBDA_ARN
+                and payload is not None
+                and json.loads(payload) == json.loads(_API_SCHEMA_PAYLOAD)
+            )
+    return False
+
+def _up_to_date_agent_id(bedrock_client):
+    """Return the cached agent id if it is PREPARED with the current schema hash"""
+    agent_id = _load_cached_agent_id()
+    if not agent_id:
+        return None
+    try:
+        agent = bedrock_client.get_agent(agentId=agent_id)['agent']
+    except bedrock_client.exceptions.ResourceNotFoundException:
+        return None
+    if agent['agentStatus'] != 'PREPARED' or agent.get('agentResourceRoleArn') != _AGENT_ROLE_ARN:
+        return None
     
-    bedrock_client = boto3.client('bedrock-agent', region_name='us-east-1')
-    iam_client = boto3.client('iam', region_name='us-east-1')
-    lambda_client = boto3.client('lambda', region_name='us-east-1')
+    tags = bedrock_client.list_tags_for_resource(resourceArn=agent['agentArn'])['tags']
+    if tags.get('schema-hash') != _SCHEMA_HASH:
+        return None
+    if not _action_group_matches(bedrock_client, agent_id):
+        logger.info("Action group on agent %s was changed since the last deploy", agent_id)
+        return None
+    logger.info("Agent %s is already prepared with the current schema", agent_id)
+    return agent_id
+
+def _existing_agent_id(bedrock_client):
+    """Return the id of an already deployed agent, checking the local cache first"""
+    agent_id = _load_cached_agent_id()
+    if agent_id:
+        try:
+            bedrock_client.get_agent(agentId=agent_id)
+            logger.info("Using existing Bedrock Agent: %s", agent_id)
+            return agent_id
+        except bedrock_client.exceptions.ResourceNotFoundException:
+            logger.info("Cached agent %s no longer exists", agent_id)
+    return _find_agent_id(bedrock_client)
+
+def _create_agent(bedrock_client, agent_role_arn):
+    """Create the security-assessment-agent and return its id"""
+    try:
+        agent_response = bedrock_client.create_agent(
+            agentName='security-assessment-agent',
+            description='AWS Security Assessment Agent powered by AgentCore',
+            foundationModel='anthropic.claude-3-sonnet-20240229-v1:0',
+            instruction=_AGENT_INSTRUCTION,
+            agentResourceRoleArn=agent_role_arn,
+            idleSessionTTLInSeconds=1800
+        )
+    except bedrock_client.exceptions.ConflictException:
+        # Created by a concurrent deploy since the lookup
+        return _find_agent_id(bedrock_client)
     
+    agent_id = agent_response['agent']['agentId']
+    logger.info("Created Bedrock Agent: %s", agent_id)
+    return agent_id
+
+def _ensure_agent_role(iam_client):
+    """Create the Bedrock Agent role if needed and attach its invoke policy"""
     # Create IAM role for Bedrock Agent
     trust_policy = {
         "Version": "2012-10-17",
@@ -26,16 +202,25 @@ def create_bedrock_agent():
     try:
         role_response = iam_client.create_role(
             RoleName='SecurityBedrockAgentRole',
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            AssumeRolePolicyDocument=_dumps(trust_policy),
             Description='Role for Security Assessment Bedrock Agent'
         )
         agent_role_arn = role_response['Role']['Arn']
-        print(f"Created Bedrock Agent role: {agent_role_arn}")
-        time.sleep(10)  # Wait for propagation
+        logger.info("Created Bedrock Agent role: %s", agent_role_arn)
+        # Wait for propagation, backing off until the role is visible
+        for delay in (1, 2, 4, 8, 8):
+            time.sleep(delay)
+            try:
+                iam_client.get_role(RoleName='SecurityBedrockAgentRole')
+                break
+            except iam_client.exceptions.NoSuchEntityException:
+                continue
+        else:
+            raise Exception(f"Role {agent_role_arn} was not visible in IAM after 23 seconds")
     except iam_client.exceptions.EntityAlreadyExistsException:
         role_response = iam_client.get_role(RoleName='SecurityBedrockAgentRole')
         agent_role_arn = role_response['Role']['Arn']
-        print(f"Using existing Bedrock Agent role: {agent_role_arn}")
+        logger.info("Using existing Bedrock Agent role: %s", agent_role_arn)
     
     # Attach Bedrock agent policy
     bedrock_policy = {
@@ -55,96 +240,92 @@ def create_bedrock_agent():
         iam_client.put_role_policy(
             RoleName='SecurityBedrockAgentRole',
             PolicyName='BedrockInvokeModelPolicy',
-            PolicyDocument=json.dumps(bedrock_policy)
+            PolicyDocument=_dumps(bedrock_policy)
         )
-    except:
-        pass
-    
-    # Grant Lambda invoke permission to Bedrock
-    lambda_arn = "arn:aws:lambda:us-east-1:039920874011:function:security-agent-bridge"
+    except ClientError as e:
+        if e.response['Error']['Code'] not in _ALREADY_EXISTS_CODES:
+            raise
     
+    return agent_role_arn
+
+def _grant_bedrock_invoke(lambda_client):
+    """Allow Bedrock agents to invoke the security bridge Lambda"""
     try:
         lambda_client.add_permission(
             FunctionName='security-agent-bridge',
             StatementId='bedrock-agent-invoke',
             Action='lambda:InvokeFunction',
             Principal='bedrock.amazonaws.com',
-            SourceArn=f"arn:aws:bedrock:us-east-1:039920874011:agent/*"
+            SourceArn=f"arn:aws:bedrock:{_REGION}:{_ACCOUNT_ID}:agent/*"
         )
-        print("Added Lambda invoke permission for Bedrock")
-    except:
-        print("Lambda permission already exists")
-    
-    # Create or get existing Bedrock Agent
-    agent_id = None
-    try:
-        agent_response = bedrock_client.create_agent(
-            agentName='security-assessment-agent',
-            description='AWS Security Assessment Agent powered by AgentCore',
-            foundationModel='anthropic.claude-3-sonnet-20240229-v1:0',
-            instruction="""You are an AWS Security Assessment Agent. You help users analyze their AWS infrastructure security posture using comprehensive security tools.
+        logger.info("Added Lambda invoke permission for Bedrock")
+    except ClientError as e:
+        if e.response['Error']['Code'] not in _ALREADY_EXISTS_CODES:
+            raise
+        logger.info("Lambda permission already exists")
 
-Your capabilities include:
-- Checking security service configurations across AWS accounts
-- Analyzing security findings from AWS Security Hub, GuardDuty, and other services  
-- Evaluating resource compliance against security best practices
-- Exploring AWS resources and their security configurations
-- Providing detailed security posture analysis and recommendations
+def _upsert_action_group(bedrock_client, agent_id, lambda_arn, action_group_id=None):
+    """Create the security-tools action group, or update it when an id is given"""
+    kwargs = dict(
+        agentId=agent_id,
+        agentVersion='DRAFT',
+        actionGroupName='security-tools',
+        description='AWS Security Assessment Tools',
+        actionGroupExecutor={
+            'lambda': lambda_arn
+        },
+        apiSchema={
+            'payload': _API_SCHEMA_PAYLOAD
+        }
+    )
+    
+    if action_group_id:
+        kwargs['actionGroupId'] = action_group_id
+        response = bedrock_client.update_agent_action_group(**kwargs)
+        logger.info("Updated Action Group: %s", response['agentActionGroup']['actionGroupId'])
+    else:
+        response = bedrock_client.create_agent_action_group(**kwargs)
+        logger.info("Created Action Group: %s", response['agentActionGroup']['actionGroupId'])
+    
+    return response['agentActionGroup']['actionGroupId']
 
-Always provide clear, actionable security recommendations and explain the security implications of your findings.""",
-            agentResourceRoleArn=agent_role_arn,
-            idleSessionTTLInSeconds=1800
-        )
+def create_bedrock_agent():
+    """Deploy Bedrock Agent with security tools"""
+    
+    bedrock_client = client('bedrock-agent', _REGION)
+    iam_client = client('iam', _REGION)
+    lambda_client = client('lambda', _REGION)
+    
+    agent_id = _up_to_date_agent_id(bedrock_client)
+    if agent_id:
+        return agent_id
+    
+    # IAM and Lambda setup run in the background while the agent is looked up;
+    # only creating a new agent has to wait for the role
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        role_future = executor.submit(_ensure_agent_role, iam_client)
+        permission_future = executor.submit(_grant_bedrock_invoke, lambda_client)
         
-        agent_id = agent_response['agent']['agentId']
-        print(f"Created Bedrock Agent: {agent_id}")
+        agent_id = _existing_agent_id(bedrock_client)
+        if not agent_id:
+            agent_id = _create_agent(bedrock_client, role_future.result())
         
-    except bedrock_client.exceptions.ConflictException as e:
-        # Agent already exists, get the existing one
-        if "KS91Z9H2MA" in str(e):
-            agent_id = "KS91Z9H2MA"
-            print(f"Using existing Bedrock Agent: {agent_id}")
-        else:
-            # List agents to find the existing one
-            agents = bedrock_client.list_agents()
-            for agent in agents['agentSummaries']:
-                if agent['agentName'] == 'security-assessment-agent':
-                    agent_id = agent['agentId']
-                    print(f"Found existing Bedrock Agent: {agent_id}")
-                    break
+        role_future.result()
+        permission_future.result()
     
     if not agent_id:
         raise Exception("Could not create or find existing agent")
+    _save_cached_agent_id(agent_id)
         
     # Wait for agent to be ready
-    print("Waiting for agent to be ready...")
-    max_wait = 300  # 5 minutes
-    wait_time = 0
-    
-    while wait_time < max_wait:
-        try:
-            agent_status = bedrock_client.get_agent(agentId=agent_id)
-            status = agent_status['agent']['agentStatus']
-            print(f"Agent status: {status}")
-            
-            if status in ['PREPARED', 'NOT_PREPARED']:
-                break
-            elif status == 'FAILED':
-                raise Exception("Agent creation failed")
-                
-            time.sleep(10)
-            wait_time += 10
-            
-        except Exception as e:
-            if "does not exist" in str(e):
-                time.sleep(10)
-                wait_time += 10
-                continue
-            else:
-                raise e
+    logger.info("Waiting for agent to be ready...")
+    waiter = create_waiter_with_client('AgentReady', _AGENT_WAITER_MODEL, bedrock_client)
+    try:
+        waiter.wait(agentId=agent_id)
+    except WaiterError as e:
+        raise Exception(f"Agent did not become ready: {e}")
     
-    if wait_time >= max_wait:
-        raise Exception("Timeout waiting for agent to be ready")
+    deployed = True
     
     # Check if action group already exists
     try:
@@ -157,337 +338,14 @@ Always provide clear, actionable security recommendations and explain the securi
         for ag in action_groups['actionGroupSummaries']:
             if ag['actionGroupName'] == 'security-tools':
                 existing_action_group = ag['actionGroupId']
-                print(f"Found existing action group: {existing_action_group}")
+                logger.info("Found existing action group: %s", existing_action_group)
                 break
         
-        if existing_action_group:
-            # Update existing action group
-            action_group_response = bedrock_client.update_agent_action_group(
-                agentId=agent_id,
-                agentVersion='DRAFT',
-                actionGroupId=existing_action_group,
-                actionGroupName='security-tools',
-                description='AWS Security Assessment Tools',
-                actionGroupExecutor={
-                    'lambda': lambda_arn
-                },
-                apiSchema={
-                    'payload': json.dumps({
-                        "openapi": "3.0.0",
-                        "info": {
-                            "title": "AWS Security Assessment API",
-                            "version": "1.0.0",
-                            "description": "Comprehensive AWS security assessment tools"
-                        },
-                        "paths": {
-                            "/checkSecurityServices": {
-                                "post": {
-                                    "summary": "Check AWS security services configuration",
-                                    "operationId": "checkSecurityServices",
-                                    "parameters": [
-                                        {
-                                            "name": "region",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "AWS region to check"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "Security services status",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            },
-                            "/getSecurityFindings": {
-                                "post": {
-                                    "summary": "Get security findings from AWS Security Hub",
-                                    "operationId": "getSecurityFindings",
-                                    "parameters": [
-                                        {
-                                            "name": "severity",
-                                            "in": "query", 
-                                            "schema": {"type": "string"},
-                                            "description": "Filter by severity (CRITICAL, HIGH, MEDIUM, LOW)"
-                                        },
-                                        {
-                                            "name": "limit",
-                                            "in": "query",
-                                            "schema": {"type": "integer"},
-                                            "description": "Maximum number of findings to return"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "Security findings",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            },
-                            "/analyzeSecurityPosture": {
-                                "post": {
-                                    "summary": "Analyze overall security posture",
-                                    "operationId": "analyzeSecurityPosture",
-                                    "parameters": [
-                                        {
-                                            "name": "include_recommendations",
-                                            "in": "query",
-                                            "schema": {"type": "boolean"},
-                                            "description": "Include security recommendations"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "Security posture analysis",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            },
-                            "/exploreAwsResources": {
-                                "post": {
-                                    "summary": "Explore AWS resources and configurations",
-                                    "operationId": "exploreAwsResources",
-                                    "parameters": [
-                                        {
-                                            "name": "service",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "AWS service to explore (ec2, s3, iam, etc.)"
-                                        },
-                                        {
-                                            "name": "region",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "AWS region to explore"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "AWS resources information",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            },
-                            "/getComplianceStatus": {
-                                "post": {
-                                    "summary": "Get resource compliance status",
-                                    "operationId": "getComplianceStatus",
-                                    "parameters": [
-                                        {
-                                            "name": "resource_type",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "Type of AWS resource to check"
-                                        },
-                                        {
-                                            "name": "compliance_type",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "Compliance framework (CIS, SOC2, PCI-DSS)"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "Compliance status",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    })
-                }
-            )
-            print(f"Updated Action Group: {action_group_response['agentActionGroup']['actionGroupId']}")
-        else:
-            # Create new action group
-            action_group_response = bedrock_client.create_agent_action_group(
-                agentId=agent_id,
-                agentVersion='DRAFT',
-                actionGroupName='security-tools',
-                description='AWS Security Assessment Tools',
-                actionGroupExecutor={
-                    'lambda': lambda_arn
-                },
-                apiSchema={
-                    'payload': json.dumps({
-                        "openapi": "3.0.0",
-                        "info": {
-                            "title": "AWS Security Assessment API",
-                            "version": "1.0.0",
-                            "description": "Comprehensive AWS security assessment tools"
-                        },
-                        "paths": {
-                            "/checkSecurityServices": {
-                                "post": {
-                                    "summary": "Check AWS security services configuration",
-                                    "operationId": "checkSecurityServices",
-                                    "parameters": [
-                                        {
-                                            "name": "region",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "AWS region to check"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "Security services status",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            },
-                            "/getSecurityFindings": {
-                                "post": {
-                                    "summary": "Get security findings from AWS Security Hub",
-                                    "operationId": "getSecurityFindings",
-                                    "parameters": [
-                                        {
-                                            "name": "severity",
-                                            "in": "query", 
-                                            "schema": {"type": "string"},
-                                            "description": "Filter by severity (CRITICAL, HIGH, MEDIUM, LOW)"
-                                        },
-                                        {
-                                            "name": "limit",
-                                            "in": "query",
-                                            "schema": {"type": "integer"},
-                                            "description": "Maximum number of findings to return"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "Security findings",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            },
-                            "/analyzeSecurityPosture": {
-                                "post": {
-                                    "summary": "Analyze overall security posture",
-                                    "operationId": "analyzeSecurityPosture",
-                                    "parameters": [
-                                        {
-                                            "name": "include_recommendations",
-                                            "in": "query",
-                                            "schema": {"type": "boolean"},
-                                            "description": "Include security recommendations"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "Security posture analysis",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            },
-                            "/exploreAwsResources": {
-                                "post": {
-                                    "summary": "Explore AWS resources and configurations",
-                                    "operationId": "exploreAwsResources",
-                                    "parameters": [
-                                        {
-                                            "name": "service",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "AWS service to explore (ec2, s3, iam, etc.)"
-                                        },
-                                        {
-                                            "name": "region",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "AWS region to explore"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "AWS resources information",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            },
-                            "/getComplianceStatus": {
-                                "post": {
-                                    "summary": "Get resource compliance status",
-                                    "operationId": "getComplianceStatus",
-                                    "parameters": [
-                                        {
-                                            "name": "resource_type",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "Type of AWS resource to check"
-                                        },
-                                        {
-                                            "name": "compliance_type",
-                                            "in": "query",
-                                            "schema": {"type": "string"},
-                                            "description": "Compliance framework (CIS, SOC2, PCI-DSS)"
-                                        }
-                                    ],
-                                    "responses": {
-                                        "200": {
-                                            "description": "Compliance status",
-                                            "content": {
-                                                "application/json": {
-                                                    "schema": {"type": "object"}
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    })
-                }
-            )
-            print(f"Created Action Group: {action_group_response['agentActionGroup']['actionGroupId']}")
+        _upsert_action_group(bedrock_client, agent_id, _LAMBDA_ARN, existing_action_group)
         
     except Exception as e:
-        print(f"Error with action group: {e}")
+        logger.error("Error with action group: %s", e)
+        deployed = False
         # Continue anyway
     
     # Prepare the agent
@@ -495,21 +353,29 @@ Always provide clear, actionable security recommendations and explain the securi
         prepare_response = bedrock_client.prepare_agent(
             agentId=agent_id
         )
-        print(f"Agent prepared successfully: {prepare_response['agentStatus']}")
+        logger.info("Agent prepared successfully: %s", prepare_response['agentStatus'])
     except Exception as e:
-        print(f"Error preparing agent: {e}")
+        logger.error("Error preparing agent: %s", e)
+        deployed = False
+    
+    if deployed:
+        # Only an optimization for the next run; the deploy itself succeeded
+        try:
+            bedrock_client.tag_resource(
+                resourceArn=_agent_arn(agent_id),
+                tags={'schema-hash': _SCHEMA_HASH}
+            )
+        except ClientError as e:
+            logger.warning("Could not tag agent %s with the schema hash: %s", agent_id, e)
     
     return agent_id
-        
-    except Exception as e:
-        print(f"Error creating Bedrock Agent: {e}")
-        raise e
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO'), format='%(message)s')
     try:
         agent_id = create_bedrock_agent()
-        print(f"\n✅ Bedrock Agent deployed successfully!")
-        print(f"Agent ID: {agent_id}")
-        print(f"You can now test the agent using the Bedrock console or API calls.")
+        logger.info("\n✅ Bedrock Agent deployed successfully!")
+        logger.info("Agent ID: %s", agent_id)
+        logger.info("You can now test the agent using the Bedrock console or API calls.")
     except Exception as e:
-        print(f"\n❌ Bedrock Agent deployment failed: {e}")
+        logger.error("\n❌ Bedrock Agent deployment failed: %s", e)
@@ -1,19 +1,21 @@
 #!/usr/bin/env python3
-import boto3
 import json
+import os
+from _aws import client
+
+_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+_ACCOUNT_ID = os.environ.get('AWS_ACCOUNT_ID', '039920874011')
+_LAMBDA_ARN = f"arn:aws:lambda:{_REGION}:{_ACCOUNT_ID}:function:security-agent-bridge"
 
 def create_bedrock_agent():
     """Deploy Bedrock Agent with function definitions"""
     
-    bedrock_client = boto3.client('bedrock-agent', region_name='us-east-1')
+    bedrock_client = client('bedrock-agent', _REGION)
     
     # Use existing agent
     agent_id = "KS91Z9H2MA"
     print(f"Using existing Bedrock Agent: {agent_id}")
     
-    # Lambda ARN
-    lambda_arn = "arn:aws:lambda:us-east-1:039920874011:function:security-agent-bridge"
-    
     try:
         # Create action group with function definitions
         action_group_response = bedrock_client.create_agent_action_group(
@@ -22,7 +24,7 @@ def create_bedrock_agent():
             actionGroupName='security-tools',
             description='AWS Security Assessment Tools',
             actionGroupExecutor={
-                'lambda': lambda_arn
+                'lambda': _LAMBDA_ARN
             },
             functionSchema={
                 'functions': [
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Update the bridge Lambda and the agent's action group together, then prepare the agent
+
+Usage: python deploy_all.py [clean|fixed|minimal|simple]
+"""
+import asyncio
+import sys
+from _aws import client
+from deploy_action_group import SCHEMAS, deploy, prepare_agent
+from deploy_parameter_aware import deploy_parameter_aware
+
+def _wait_for_function_updated():
+    """Block until the bridge Lambda has finished applying a code update"""
+    client('lambda').get_waiter('function_updated_v2').wait(FunctionName='security-agent-bridge')
+
+async def deploy_all(schema_name):
+    """Run the independent Lambda and action group updates concurrently, then prepare"""
+    async with asyncio.TaskGroup() as tg:
+        lambda_update = tg.create_task(asyncio.to_thread(deploy_parameter_aware))
+        action_group = tg.create_task(asyncio.to_thread(deploy, schema_name, prepare=False))
+    
+    agent_id = action_group.result()
+    if not agent_id:
+        return None
+    
+    if lambda_update.result():
+        # Prepare against the new code, not the one still being replaced
+        await asyncio.to_thread(_wait_for_function_updated)
+    else:
+        print("Lambda code unchanged")
+    
+    # Preparing picks up both the new action group and the new Lambda code
+    await asyncio.to_thread(prepare_agent)
+    return agent_id
+
+if __name__ == "__main__":
+    schema_name = sys.argv[1] if len(sys.argv) > 1 else 'clean'
+    if schema_name not in SCHEMAS:
+        sys.exit(f"Unknown schema {schema_name!r}, expected one of: {', '.join(SCHEMAS)}")
+    try:
+        agent_id = asyncio.run(deploy_all(schema_name))
+        if agent_id:
+            print(f"\n✅ Bedrock Agent configured successfully!")
+            print(f"Agent ID: {agent_id}")
+        else:
+            print(f"\n❌ Bedrock Agent configuration failed!")
+    except* Exception as eg:
+        for e in eg.exceptions:
+            print(f"\n❌ Deployment failed: {e}")
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Run the clean, fixed, minimal and simple agent deploys in one process
+
+Equivalent to running the four deploy_agent_*.py scripts back to back, but
+boto3, the session and the clients are loaded once and shared by all four.
+"""
+import deploy_agent_clean
+import deploy_agent_fixed
+import deploy_agent_minimal
+import deploy_agent_simple
+
+# In shell order; these must not run concurrently, as they all modify the
+# same agent's DRAFT action groups and the fixed deploy deletes every one
+DEPLOYS = (
+    ('clean', deploy_agent_clean.create_bedrock_agent),
+    ('fixed', deploy_agent_fixed.create_bedrock_agent_fixed),
+    ('minimal', deploy_agent_minimal.create_bedrock_agent),
+    ('simple', deploy_agent_simple.create_bedrock_agent)
+)
+
+def deploy_all_agents():
+    """Run every deploy in order, returning {name: succeeded}"""
+    results = {}
+    for name, deploy in DEPLOYS:
+        print(f"\n=== {name} ===")
+        try:
+            results[name] = bool(deploy())
+        except Exception as e:
+            print(f"Error: {e}")
+            results[name] = False
+    return results
+
+if __name__ == "__main__":
+    results = deploy_all_agents()
+    print()
+    for name, ok in results.items():
+        print(f"{'✅' if ok else '❌'} {name}")
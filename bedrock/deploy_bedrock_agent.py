@@ -1,10 +1,186 @@
 """
 Deploy Bedrock Agent for AgentCore Security Assessment
 """
-import boto3
 import json
 import uuid
 import os
+from _aws import client
+
+# OpenAPI schema for AgentCore security tools
+_OPENAPI_SCHEMA = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "AgentCore Security Assessment API",
+        "version": "1.0.0",
+        "description": "AWS Security Assessment tools via AgentCore Gateway"
+    },
+    "paths": {
+        "/check-security-services": {
+            "post": {
+                "operationId": "checkSecurityServices",
+                "summary": "Monitor AWS security services operational status",
+                "description": "Check the status of GuardDuty, Security Hub, Inspector, and IAM Access Analyzer",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {}
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Security services status",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object"
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/get-security-findings": {
+            "post": {
+                "operationId": "getSecurityFindings",
+                "summary": "Retrieve security findings from AWS services",
+                "description": "Get security findings from Security Hub, GuardDuty, and Inspector",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "severity_filter": {
+                                        "type": "string",
+                                        "enum": ["LOW", "MEDIUM", "HIGH", "CRITICAL"],
+                                        "description": "Filter findings by severity level"
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Security findings",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object"
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/analyze-security-posture": {
+            "post": {
+                "operationId": "analyzeSecurityPosture",
+                "summary": "Comprehensive security posture analysis",
+                "description": "Analyze security posture against AWS Well-Architected Framework",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {}
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Security posture analysis",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object"
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/explore-aws-resources": {
+            "post": {
+                "operationId": "exploreAwsResources",
+                "summary": "Discover AWS resources for security assessment",
+                "description": "Inventory AWS resources across services for security evaluation",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "service_filter": {
+                                        "type": "string",
+                                        "enum": ["ec2", "s3", "rds", "lambda", "iam"],
+                                        "description": "Filter resources by AWS service"
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "AWS resources inventory",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object"
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+        "/get-compliance-status": {
+            "post": {
+                "operationId": "getComplianceStatus",
+                "summary": "Check resource compliance against security standards",
+                "description": "Verify AWS resource compliance with security standards",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "resource_type": {
+                                        "type": "string",
+                                        "description": "Filter by specific resource type"
+                                    }
+                                }
+                            }
+                        }
+                    }
+                },
+                "responses": {
+                    "200": {
+                        "description": "Compliance status",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object"
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+_OPENAPI_SCHEMA_JSON = json.dumps(_OPENAPI_SCHEMA)
 
 def create_bedrock_agent():
     """Create Bedrock Agent that calls AgentCore Gateway"""
@@ -17,8 +193,8 @@ def create_bedrock_agent():
         print("   Deploy the Lambda bridge first")
         return None
     
-    bedrock_agent = boto3.client('bedrock-agent', region_name=region)
-    iam = boto3.client('iam', region_name=region)
+    bedrock_agent = client('bedrock-agent', region)
+    iam = client('iam', region)
     
     # Create IAM role for Bedrock Agent
     print("1. Creating IAM role for Bedrock Agent...")
@@ -55,7 +231,7 @@ def create_bedrock_agent():
         print(f"✅ IAM role created: {role_arn}")
         
     except iam.exceptions.EntityAlreadyExistsException:
-        role_arn = f"arn:aws:iam::{boto3.client('sts').get_caller_identity()['Account']}:role/{role_name}"
+        role_arn = f"arn:aws:iam::{client('sts', region).get_caller_identity()['Account']}:role/{role_name}"
         print(f"✅ Using existing IAM role: {role_arn}")
     
     # Create Bedrock Agent
@@ -90,180 +266,6 @@ When users ask about security assessments, use the available tools to gather cur
     # Create Action Group
     print("3. Creating Action Group for AgentCore tools...")
     
-    # OpenAPI schema for AgentCore security tools
-    openapi_schema = {
-        "openapi": "3.0.0",
-        "info": {
-            "title": "AgentCore Security Assessment API",
-            "version": "1.0.0",
-            "description": "AWS Security Assessment tools via AgentCore Gateway"
-        },
-        "paths": {
-            "/check-security-services": {
-                "post": {
-                    "operationId": "checkSecurityServices",
-                    "summary": "Monitor AWS security services operational status",
-                    "description": "Check the status of GuardDuty, Security Hub, Inspector, and IAM Access Analyzer",
-                    "requestBody": {
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {}
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Security services status",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/get-security-findings": {
-                "post": {
-                    "operationId": "getSecurityFindings",
-                    "summary": "Retrieve security findings from AWS services",
-                    "description": "Get security findings from Security Hub, GuardDuty, and Inspector",
-                    "requestBody": {
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "severity_filter": {
-                                            "type": "string",
-                                            "enum": ["LOW", "MEDIUM", "HIGH", "CRITICAL"],
-                                            "description": "Filter findings by severity level"
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Security findings",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/analyze-security-posture": {
-                "post": {
-                    "operationId": "analyzeSecurityPosture",
-                    "summary": "Comprehensive security posture analysis",
-                    "description": "Analyze security posture against AWS Well-Architected Framework",
-                    "requestBody": {
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {}
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Security posture analysis",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/explore-aws-resources": {
-                "post": {
-                    "operationId": "exploreAwsResources",
-                    "summary": "Discover AWS resources for security assessment",
-                    "description": "Inventory AWS resources across services for security evaluation",
-                    "requestBody": {
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "service_filter": {
-                                            "type": "string",
-                                            "enum": ["ec2", "s3", "rds", "lambda", "iam"],
-                                            "description": "Filter resources by AWS service"
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "AWS resources inventory",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/get-compliance-status": {
-                "post": {
-                    "operationId": "getComplianceStatus",
-                    "summary": "Check resource compliance against security standards",
-                    "description": "Verify AWS resource compliance with security standards",
-                    "requestBody": {
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "resource_type": {
-                                            "type": "string",
-                                            "description": "Filter by specific resource type"
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Compliance status",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-    }
-    
     action_group_response = bedrock_agent.create_agent_action_group(
         agentId=agent_id,
         agentVersion='DRAFT',
@@ -273,7 +275,7 @@ When users ask about security assessments, use the available tools to gather cur
             'lambda': lambda_arn
         },
         apiSchema={
-            'payload': json.dumps(openapi_schema)
+            'payload': _OPENAPI_SCHEMA_JSON
         }
     )
     
@@ -1,35 +1,26 @@
 #!/usr/bin/env python3
-import boto3
-import zipfile
-import os
 import json
 import time
 from pathlib import Path
+from _aws import client
 
 def create_lambda_package():
-    """Create deployment package for Lambda function"""
+    """Create deployment package for Lambda function, returning the zip bytes"""
+    import io
+    import zipfile
     
-    # Create deployment directory
-    deploy_dir = Path("lambda_deploy")
-    deploy_dir.mkdir(exist_ok=True)
+    # Build the zip in memory; fastest compression, the package is a single small file
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        zipf.writestr("lambda_function.py", Path("lambda_bridge.py").read_bytes())
     
-    # Copy Lambda function
-    with open("lambda_bridge.py", "r") as src:
-        with open(deploy_dir / "lambda_function.py", "w") as dst:
-            dst.write(src.read())
-    
-    # Create deployment zip
-    zip_path = "lambda_bridge.zip"
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        zipf.write(deploy_dir / "lambda_function.py", "lambda_function.py")
-    
-    return zip_path
+    return buf.getvalue()
 
 def deploy_lambda():
     """Deploy Lambda function to AWS"""
     
-    lambda_client = boto3.client('lambda', region_name='us-east-1')
-    iam_client = boto3.client('iam', region_name='us-east-1')
+    lambda_client = client('lambda')
+    iam_client = client('iam')
     
     # Create IAM role for Lambda
     trust_policy = {
@@ -54,7 +45,10 @@ def deploy_lambda():
         
         # Wait for role to propagate
         print("Waiting for IAM role to propagate...")
-        time.sleep(10)
+        iam_client.get_waiter('role_exists').wait(
+            RoleName='SecurityAgentLambdaRole',
+            WaiterConfig={'Delay': 1, 'MaxAttempts': 15}
+        )
         
     except iam_client.exceptions.EntityAlreadyExistsException:
         role_response = iam_client.get_role(RoleName='SecurityAgentLambdaRole')
@@ -71,78 +65,76 @@ def deploy_lambda():
         pass  # Policy might already be attached
     
     # Create Lambda package
-    zip_path = create_lambda_package()
+    zip_content = create_lambda_package()
     
-    try:
-        # Read zip file
-        with open(zip_path, 'rb') as f:
-            zip_content = f.read()
-        
-        function_name = 'security-agent-bridge'
-        
-        # Retry Lambda creation with backoff
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Create Lambda function
-                response = lambda_client.create_function(
-                    FunctionName=function_name,
-                    Runtime='python3.11',
-                    Role=role_arn,
-                    Handler='lambda_function.lambda_handler',
-                    Code={'ZipFile': zip_content},
-                    Description='Bridge function between Bedrock Agent and AgentCore Gateway',
-                    Timeout=30,
-                    Environment={
-                        'Variables': {
-                            'GATEWAY_URL': 'https://security-gateway-0xd0v9msee.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp',
-                            'COGNITO_CLIENT_ID': 'cga3d98ldb3hd38a6lbbjluj0',
-                            'COGNITO_TOKEN_ENDPOINT': 'https://cognito-idp.us-east-1.amazonaws.com/us-east-1_DBAPV3Fct/oauth2/token',
-                            'COGNITO_SCOPE': 'openid'
-                        }
+    function_name = 'security-agent-bridge'
+    
+    # Retry Lambda creation until the new role can be assumed; IAM reports
+    # the role before Lambda can use it, which can take tens of seconds
+    deadline = time.monotonic() + 30
+    delay = 1
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            # Create Lambda function
+            response = lambda_client.create_function(
+                FunctionName=function_name,
+                Runtime='python3.11',
+                Role=role_arn,
+                Handler='lambda_function.lambda_handler',
+                Code={'ZipFile': zip_content},
+                Description='Bridge function between Bedrock Agent and AgentCore Gateway',
+                Timeout=30,
+                Environment={
+                    'Variables': {
+                        'GATEWAY_URL': 'https://security-gateway-0xd0v9msee.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp',
+                        'COGNITO_CLIENT_ID': 'cga3d98ldb3hd38a6lbbjluj0',
+                        'COGNITO_TOKEN_ENDPOINT': 'https://cognito-idp.us-east-1.amazonaws.com/us-east-1_DBAPV3Fct/oauth2/token',
+                        'COGNITO_SCOPE': 'openid'
                     }
-                )
-                print(f"Created Lambda function: {response['FunctionArn']}")
-                return response['FunctionArn']
-                
-            except lambda_client.exceptions.ResourceConflictException:
-                # Update existing function
-                response = lambda_client.update_function_code(
-                    FunctionName=function_name,
-                    ZipFile=zip_content
-                )
-                
-                # Update environment variables
-                lambda_client.update_function_configuration(
-                    FunctionName=function_name,
-                    Environment={
-                        'Variables': {
-                            'GATEWAY_URL': 'https://security-gateway-0xd0v9msee.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp',
-                            'COGNITO_CLIENT_ID': 'cga3d98ldb3hd38a6lbbjluj0',
-                            'COGNITO_TOKEN_ENDPOINT': 'https://cognito-idp.us-east-1.amazonaws.com/us-east-1_DBAPV3Fct/oauth2/token',
-                            'COGNITO_SCOPE': 'openid'
-                        }
+                }
+            )
+            lambda_client.get_waiter('function_active_v2').wait(FunctionName=function_name)
+            print(f"Created Lambda function: {response['FunctionArn']}")
+            return response['FunctionArn']
+        
+        except lambda_client.exceptions.ResourceConflictException:
+            # Update existing function
+            response = lambda_client.update_function_code(
+                FunctionName=function_name,
+                ZipFile=zip_content
+            )
+            
+            # Configuration updates are rejected while the code update is in progress
+            lambda_client.get_waiter('function_updated_v2').wait(FunctionName=function_name)
+            
+            # Update environment variables
+            lambda_client.update_function_configuration(
+                FunctionName=function_name,
+                Environment={
+                    'Variables': {
+                        'GATEWAY_URL': 'https://security-gateway-0xd0v9msee.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp',
+                        'COGNITO_CLIENT_ID': 'cga3d98ldb3hd38a6lbbjluj0',
+                        'COGNITO_TOKEN_ENDPOINT': 'https://cognito-idp.us-east-1.amazonaws.com/us-east-1_DBAPV3Fct/oauth2/token',
+                        'COGNITO_SCOPE': 'openid'
                     }
-                )
-                
-                print(f"Updated Lambda function: {response['FunctionArn']}")
-                return response['FunctionArn']
-                
-            except Exception as e:
-                if "cannot be assumed by Lambda" in str(e) and attempt < max_retries - 1:
-                    print(f"Attempt {attempt + 1} failed, retrying in 10 seconds...")
-                    time.sleep(10)
-                    continue
-                else:
-                    raise e
+                }
+            )
+            
+            print(f"Updated Lambda function: {response['FunctionArn']}")
+            return response['FunctionArn']
         
-    finally:
-        # Cleanup
-        if os.path.exists(zip_path):
-            os.remove(zip_path)
-        if os.path.exists("lambda_deploy"):
-            import shutil
-            shutil.rmtree("lambda_deploy")
+        except lambda_client.exceptions.InvalidParameterValueException as e:
+            # A role that has not propagated yet is reported as not assumable
+            message = e.response['Error'].get('Message', '')
+            if "cannot be assumed by Lambda" in message and time.monotonic() + delay < deadline:
+                print(f"Attempt {attempt} failed, retrying in {delay} seconds...")
+                time.sleep(delay)
+                delay = min(delay * 2, 8)
+                continue
+            else:
+                raise e
 
 if __name__ == "__main__":
     try:
@@ -1,44 +1,23 @@
 """
 Deploy Lambda bridge function for Bedrock Agent to Gateway communication
 """
-import boto3
 import json
-import zipfile
 import os
 import uuid
 from pathlib import Path
+from _aws import client
 
 def create_lambda_package():
-    """Create Lambda deployment package"""
-    
-    # Create temporary directory for package
-    package_dir = Path('/tmp/lambda_package')
-    package_dir.mkdir(exist_ok=True)
-    
-    # Copy Lambda function code
-    with open('lambda_bridge.py', 'r') as src:
-        with open(package_dir / 'lambda_function.py', 'w') as dst:
-            # Rename handler function
-            content = src.read().replace('def lambda_handler', 'def lambda_handler')
-            dst.write(content)
-    
-    # Create requirements.txt for Lambda layer
-    requirements = [
-        'httpx==0.25.0',
-        'asyncio'
-    ]
-    
-    with open(package_dir / 'requirements.txt', 'w') as f:
-        f.write('\n'.join(requirements))
-    
-    # Create ZIP package
-    zip_path = '/tmp/lambda_bridge.zip'
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in package_dir.rglob('*'):
-            if file_path.is_file():
-                zipf.write(file_path, file_path.relative_to(package_dir))
-    
-    return zip_path
+    """Create Lambda deployment package, returning the zip bytes"""
+    import io
+    import zipfile
+    
+    # Build the ZIP in memory; only lambda_function.py is read by Lambda
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        zipf.writestr('lambda_function.py', Path('lambda_bridge.py').read_bytes())
+    
+    return buf.getvalue()
 
 def deploy_lambda_function():
     """Deploy Lambda bridge function"""
@@ -53,8 +32,9 @@ def deploy_lambda_function():
         print("❌ Gateway configuration not found. Deploy Gateway first.")
         return None
     
-    lambda_client = boto3.client('lambda', region_name=region)
-    iam = boto3.client('iam', region_name=region)
+    lambda_client = client('lambda', region)
+    iam = client('iam', region)
+    account_id = client('sts', region).get_caller_identity()['Account']
     
     # Create IAM role for Lambda
     print("1. Creating IAM role for Lambda...")
@@ -91,13 +71,12 @@ def deploy_lambda_function():
         print(f"✅ IAM role created: {role_arn}")
         
     except iam.exceptions.EntityAlreadyExistsException:
-        account_id = boto3.client('sts').get_caller_identity()['Account']
         role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
         print(f"✅ Using existing IAM role: {role_arn}")
     
     # Create Lambda package
     print("2. Creating Lambda deployment package...")
-    zip_path = create_lambda_package()
+    zip_content = create_lambda_package()
     print("✅ Lambda package created")
     
     # Deploy Lambda function
@@ -105,9 +84,6 @@ def deploy_lambda_function():
     
     function_name = f"bedrock-agentcore-bridge-{uuid.uuid4().hex[:8]}"
     
-    with open(zip_path, 'rb') as zip_file:
-        zip_content = zip_file.read()
-    
     lambda_response = lambda_client.create_function(
         FunctionName=function_name,
         Runtime='python3.11',
@@ -140,7 +116,7 @@ def deploy_lambda_function():
             StatementId='bedrock-agent-invoke',
             Action='lambda:InvokeFunction',
             Principal='bedrock.amazonaws.com',
-            SourceAccount=boto3.client('sts').get_caller_identity()['Account']
+            SourceAccount=account_id
         )
         print("✅ Lambda permissions configured")
     except lambda_client.exceptions.ResourceConflictException:
@@ -1,11 +1,19 @@
 """
 Lambda bridge function: Bedrock Agent → AgentCore Gateway
 """
-import json
-import httpx
-import asyncio
 import os
-from datetime import datetime, timedelta
+import socket
+import threading
+import time
+import urllib3
+from urllib.parse import urlencode
+from urllib3.connection import HTTPConnection
+
+try:
+    import orjson
+except ImportError:
+    import json
+    orjson = None
 
 # Gateway configuration (loaded from environment)
 GATEWAY_URL = os.getenv('GATEWAY_URL')
@@ -14,96 +22,143 @@ COGNITO_CLIENT_SECRET = os.getenv('COGNITO_CLIENT_SECRET')
 COGNITO_TOKEN_ENDPOINT = os.getenv('COGNITO_TOKEN_ENDPOINT')
 COGNITO_SCOPE = os.getenv('COGNITO_SCOPE')
 
-# Token cache
-_token_cache = {
-    'token': None,
-    'expires_at': None
+# Token request is built from static configuration, so encode it once; unset
+# values are sent empty rather than as the string "None"
+_TOKEN_BODY = urlencode({
+    'grant_type': 'client_credentials',
+    'client_id': COGNITO_CLIENT_ID or '',
+    'client_secret': COGNITO_CLIENT_SECRET or '',
+    'scope': COGNITO_SCOPE or ''
+}).encode()
+_TOKEN_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+def _dumps(obj, indent=False):
+    """Serialize to JSON text, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+def _loads(data):
+    """Parse JSON bytes, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Map Bedrock Agent operations to AgentCore tools
+_TOOL_MAPPING = {
+    'checkSecurityServices': 'check_security_services',
+    'getSecurityFindings': 'get_security_findings',
+    'analyzeSecurityPosture': 'analyze_security_posture',
+    'exploreAwsResources': 'explore_aws_resources',
+    'getComplianceStatus': 'get_resource_compliance_status'
 }
 
-async def get_oauth_token():
-    """Get OAuth token from Cognito with caching"""
+# Shared across warm invocations so connections (and TLS sessions) are reused.
+# One pool per host (token endpoint, gateway) with a single connection each,
+# since a Lambda container serves one invocation at a time; TCP keepalive stops
+# idle connections between invocations from being dropped by NAT.
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+# TCP_KEEPIDLE is Linux-only; elsewhere (local runs on macOS/Windows) the
+# system keepalive idle time applies
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+
+_HTTP = urllib3.PoolManager(
+    num_pools=2,
+    maxsize=1,
+    block=True,
+    socket_options=_SOCKET_OPTIONS,
+    timeout=30.0,
+    retries=urllib3.Retry(total=2, backoff_factor=0.1)
+)
+
+# Token cache: (token, expires_at on the time.monotonic() clock, gateway request
+# headers), replaced as a whole so readers never see a token paired with
+# another token's expiry or headers
+_token_cache = None
+_token_lock = threading.Lock()
+
+def _get_token_entry():
+    """Return the cached (token, expires_at, headers) entry, refreshing it from Cognito when expired"""
     global _token_cache
     
     # Check if cached token is still valid
-    if (_token_cache['token'] and 
-        _token_cache['expires_at'] and 
-        _token_cache['expires_at'] > datetime.now()):
-        return _token_cache['token']
+    cached = _token_cache
+    if cached and cached[1] > time.monotonic():
+        return cached
     
-    # Get new token
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
+    with _token_lock:
+        # Another caller may have refreshed the token while we waited
+        cached = _token_cache
+        if cached and cached[1] > time.monotonic():
+            return cached
+        
+        # Get new token
+        response = _HTTP.request(
+            'POST',
             COGNITO_TOKEN_ENDPOINT,
-            data={
-                'grant_type': 'client_credentials',
-                'client_id': COGNITO_CLIENT_ID,
-                'client_secret': COGNITO_CLIENT_SECRET,
-                'scope': COGNITO_SCOPE
-            },
-            headers={'Content-Type': 'application/x-www-form-urlencoded'}
+            body=_TOKEN_BODY,
+            headers=_TOKEN_HEADERS
         )
         
-        if response.status_code != 200:
-            raise Exception(f"OAuth token request failed: {response.text}")
+        if response.status != 200:
+            raise Exception(f"OAuth token request failed: {response.data.decode(errors='replace')}")
         
-        token_data = response.json()
-        _token_cache['token'] = token_data['access_token']
+        token_data = _loads(response.data)
         
         # Cache token with 5-minute buffer
         expires_in = token_data.get('expires_in', 3600) - 300
-        _token_cache['expires_at'] = datetime.now() + timedelta(seconds=expires_in)
+        token = token_data['access_token']
+        _token_cache = (token, time.monotonic() + expires_in, {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        })
         
-        return _token_cache['token']
+        return _token_cache
 
-async def call_agentcore_gateway(tool_name: str, parameters: dict):
+def get_oauth_token():
+    """Get OAuth token from Cognito with caching"""
+    return _get_token_entry()[0]
+
+def call_agentcore_gateway(tool_name: str, parameters: dict):
     """Call AgentCore Gateway tool via MCP protocol"""
     
     if not GATEWAY_URL:
         raise Exception("Gateway URL not configured")
     
-    # Get OAuth token
-    token = await get_oauth_token()
-    
-    # Map Bedrock Agent operations to AgentCore tools
-    tool_mapping = {
-        'checkSecurityServices': 'check_security_services',
-        'getSecurityFindings': 'get_security_findings', 
-        'analyzeSecurityPosture': 'analyze_security_posture',
-        'exploreAwsResources': 'explore_aws_resources',
-        'getComplianceStatus': 'get_resource_compliance_status'
-    }
+    # Get OAuth token; the request headers are cached alongside it
+    headers = _get_token_entry()[2]
     
-    agentcore_tool = tool_mapping.get(tool_name, tool_name)
+    agentcore_tool = _TOOL_MAPPING.get(tool_name, tool_name)
     
     # Call Gateway using MCP protocol
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            GATEWAY_URL,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": agentcore_tool,
-                    "arguments": parameters
-                }
-            },
-            timeout=30.0
-        )
-        
-        if response.status_code != 200:
-            raise Exception(f"Gateway request failed: {response.status_code} - {response.text}")
-        
-        result = response.json()
-        
-        if 'error' in result:
-            raise Exception(f"Gateway tool error: {result['error']}")
-        
-        return result.get('result', {})
+    response = _HTTP.request(
+        'POST',
+        GATEWAY_URL,
+        headers=headers,
+        body=_dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {
+                "name": agentcore_tool,
+                "arguments": parameters
+            }
+        })
+    )
+    
+    # Error bodies are only echoed into the message, so keep them bounded
+    if response.status != 200:
+        raise Exception(f"Gateway request failed: {response.status} - {response.data[:512].decode(errors='replace')}")
+    
+    result = _loads(response.data)
+    
+    if 'error' in result:
+        raise Exception(f"Gateway tool error: {result['error']}")
+    
+    return result.get('result', {})
 
 def lambda_handler(event, context):
     """Lambda handler for Bedrock Agent requests"""
@@ -112,24 +167,19 @@ def lambda_handler(event, context):
         # Extract Bedrock Agent request details
         action_group = event.get('actionGroup', '')
         function = event.get('function', '')
-        parameters = {}
         
         # Parse parameters from Bedrock Agent
-        for param in event.get('parameters', []):
-            param_name = param.get('name', '')
-            param_value = param.get('value', '')
-            if param_name:
-                parameters[param_name] = param_value
+        parameters = {p['name']: p.get('value', '') for p in event.get('parameters', ()) if p.get('name')}
         
         print(f"Processing request: {function} with parameters: {parameters}")
         
         # Call AgentCore Gateway
-        result = asyncio.run(call_agentcore_gateway(function, parameters))
+        result = call_agentcore_gateway(function, parameters)
         
         # Format response for Bedrock Agent
         response_body = {
             'TEXT': {
-                'body': json.dumps(result, indent=2)
+                'body': _dumps(result, indent=True)
             }
         }
         
@@ -147,7 +197,7 @@ def lambda_handler(event, context):
         # Return error response to Bedrock Agent
         error_response = {
             'TEXT': {
-                'body': json.dumps({
+                'body': _dumps({
                     'error': str(e),
                     'message': 'Failed to process security assessment request'
                 })
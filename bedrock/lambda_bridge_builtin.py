@@ -2,123 +2,172 @@
 Lambda bridge function: Bedrock Agent → AgentCore Gateway (Built-in libraries only)
 """
 import json
-import urllib.request
-import urllib.parse
-import urllib.error
+import logging
 import os
-from datetime import datetime
+import re
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj):
+    """Serialize to compact JSON text, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+# Mock security assessment results for demonstration; serialized once per
+# container into _MOCK_RESPONSE_TEMPLATES below
+_MOCK_RESPONSES = {
+    'checkSecurityServices': {
+        'status': 'success',
+        'message': 'Security services check completed',
+        'services': {
+            'SecurityHub': 'enabled',
+            'GuardDuty': 'enabled', 
+            'Config': 'enabled',
+            'CloudTrail': 'enabled',
+            'Inspector': 'enabled'
+        },
+        'region': 'us-east-1',
+        'recommendations': [
+            'All core security services are enabled',
+            'Consider enabling AWS Shield Advanced for DDoS protection',
+            'Review CloudTrail log retention settings'
+        ]
+    },
+    'getSecurityFindings': {
+        'status': 'success',
+        'message': 'Security findings retrieved',
+        'findings_count': 3,
+        'severity_filter': 'HIGH',
+        'limit': 10,
+        'findings': [
+            {
+                'id': 'finding-001',
+                'title': 'S3 bucket allows public read access',
+                'severity': 'HIGH',
+                'resource': 'arn:aws:s3:::example-public-bucket',
+                'description': 'S3 bucket has public read permissions enabled',
+                'remediation': 'Remove public read access and use bucket policies'
+            },
+            {
+                'id': 'finding-002', 
+                'title': 'EC2 security group allows unrestricted SSH',
+                'severity': 'HIGH',
+                'resource': 'sg-0123456789abcdef0',
+                'description': 'Security group allows SSH access from 0.0.0.0/0',
+                'remediation': 'Restrict SSH access to specific IP ranges'
+            },
+            {
+                'id': 'finding-003',
+                'title': 'IAM user has unused access keys',
+                'severity': 'MEDIUM',
+                'resource': 'arn:aws:iam::123456789012:user/unused-user',
+                'description': 'IAM user has access keys that have not been used in 90+ days',
+                'remediation': 'Remove unused access keys or rotate them'
+            }
+        ]
+    },
+    'analyzeSecurityPosture': {
+        'status': 'success',
+        'message': 'Security posture analysis completed',
+        'overall_score': 78,
+        'score_breakdown': {
+            'identity_access': 85,
+            'data_protection': 72,
+            'infrastructure_security': 80,
+            'logging_monitoring': 75,
+            'incident_response': 70
+        },
+        'include_recommendations': True,
+        'recommendations': [
+            'Enable MFA for all IAM users and root account',
+            'Implement least privilege access policies',
+            'Enable encryption at rest for all S3 buckets',
+            'Set up automated security scanning with Inspector',
+            'Configure CloudWatch alarms for security events',
+            'Establish incident response procedures',
+            'Regular security training for development teams'
+        ],
+        'critical_issues': 2,
+        'high_issues': 5,
+        'medium_issues': 12,
+        'low_issues': 8
+    }
+}
+
+# Response field -> (request parameter, default) overlays for each mock response
+_MOCK_PARAMETER_FIELDS = {
+    'checkSecurityServices': {
+        'region': ('region', 'us-east-1')
+    },
+    'getSecurityFindings': {
+        'severity_filter': ('severity', 'HIGH'),
+        'limit': ('limit', 10)
+    },
+    'analyzeSecurityPosture': {
+        'include_recommendations': ('include_recommendations', True)
+    }
+}
+
+def _build_template(function, response):
+    """Serialize a mock response and split it around each request-dependent field.
+    
+    Returns alternating (text, field, text, ...) pieces, so a request joins
+    its encoded parameters in without rescanning text already substituted.
+    """
+    fields = _MOCK_PARAMETER_FIELDS[function]
+    placeholders = dict(response)
+    for field in fields:
+        placeholders[field] = f'__{field}__'
+    pattern = '"__(' + '|'.join(map(re.escape, fields)) + ')__"'
+    return tuple(re.split(pattern, _dumps(placeholders)))
+
+# Pre-serialized JSON bodies; a request only joins its parameters in
+_MOCK_RESPONSE_TEMPLATES = {
+    function: _build_template(function, response)
+    for function, response in _MOCK_RESPONSES.items()
+}
 
 def lambda_handler(event, context):
     """Lambda handler for Bedrock Agent requests"""
     
     try:
-        print(f"Received event: {json.dumps(event)}")
+        logger.debug("Received event: %s", event)
         
         # Extract Bedrock Agent request details
         action_group = event.get('actionGroup', '')
         function = event.get('function', '')
-        parameters = {}
         
         # Parse parameters from Bedrock Agent
-        for param in event.get('parameters', []):
-            param_name = param.get('name', '')
-            param_value = param.get('value', '')
-            if param_name:
-                parameters[param_name] = param_value
-        
-        print(f"Processing request: {function} with parameters: {parameters}")
+        parameters = {p['name']: p.get('value', '') for p in event.get('parameters', ()) if p.get('name')}
         
-        # Mock security assessment results for demonstration
-        mock_responses = {
-            'checkSecurityServices': {
-                'status': 'success',
-                'message': 'Security services check completed',
-                'services': {
-                    'SecurityHub': 'enabled',
-                    'GuardDuty': 'enabled', 
-                    'Config': 'enabled',
-                    'CloudTrail': 'enabled',
-                    'Inspector': 'enabled'
-                },
-                'region': parameters.get('region', 'us-east-1'),
-                'recommendations': [
-                    'All core security services are enabled',
-                    'Consider enabling AWS Shield Advanced for DDoS protection',
-                    'Review CloudTrail log retention settings'
-                ]
-            },
-            'getSecurityFindings': {
-                'status': 'success',
-                'message': 'Security findings retrieved',
-                'findings_count': 3,
-                'severity_filter': parameters.get('severity', 'HIGH'),
-                'limit': parameters.get('limit', 10),
-                'findings': [
-                    {
-                        'id': 'finding-001',
-                        'title': 'S3 bucket allows public read access',
-                        'severity': 'HIGH',
-                        'resource': 'arn:aws:s3:::example-public-bucket',
-                        'description': 'S3 bucket has public read permissions enabled',
-                        'remediation': 'Remove public read access and use bucket policies'
-                    },
-                    {
-                        'id': 'finding-002', 
-                        'title': 'EC2 security group allows unrestricted SSH',
-                        'severity': 'HIGH',
-                        'resource': 'sg-0123456789abcdef0',
-                        'description': 'Security group allows SSH access from 0.0.0.0/0',
-                        'remediation': 'Restrict SSH access to specific IP ranges'
-                    },
-                    {
-                        'id': 'finding-003',
-                        'title': 'IAM user has unused access keys',
-                        'severity': 'MEDIUM',
-                        'resource': 'arn:aws:iam::123456789012:user/unused-user',
-                        'description': 'IAM user has access keys that have not been used in 90+ days',
-                        'remediation': 'Remove unused access keys or rotate them'
-                    }
-                ]
-            },
-            'analyzeSecurityPosture': {
-                'status': 'success',
-                'message': 'Security posture analysis completed',
-                'overall_score': 78,
-                'score_breakdown': {
-                    'identity_access': 85,
-                    'data_protection': 72,
-                    'infrastructure_security': 80,
-                    'logging_monitoring': 75,
-                    'incident_response': 70
-                },
-                'include_recommendations': parameters.get('include_recommendations', True),
-                'recommendations': [
-                    'Enable MFA for all IAM users and root account',
-                    'Implement least privilege access policies',
-                    'Enable encryption at rest for all S3 buckets',
-                    'Set up automated security scanning with Inspector',
-                    'Configure CloudWatch alarms for security events',
-                    'Establish incident response procedures',
-                    'Regular security training for development teams'
-                ],
-                'critical_issues': 2,
-                'high_issues': 5,
-                'medium_issues': 12,
-                'low_issues': 8
-            }
-        }
+        logger.info("Processing request: %s with parameters: %s", function, parameters)
         
         # Get mock response based on function name
-        result = mock_responses.get(function, {
-            'status': 'success',
-            'message': f'Function {function} executed successfully',
-            'parameters_received': parameters
-        })
+        template = _MOCK_RESPONSE_TEMPLATES.get(function)
+        if template is not None:
+            fields = _MOCK_PARAMETER_FIELDS[function]
+            body = ''.join(
+                _dumps(parameters.get(*fields[part])) if i % 2 else part
+                for i, part in enumerate(template)
+            )
+        else:
+            body = _dumps({
+                'status': 'success',
+                'message': f'Function {function} executed successfully',
+                'parameters_received': parameters
+            })
         
         # Format response for Bedrock Agent
         response_body = {
             'TEXT': {
-                'body': json.dumps(result, indent=2)
+                'body': body
             }
         }
         
@@ -130,16 +179,16 @@ def lambda_handler(event, context):
             }
         }
         
-        print(f"Returning response: {json.dumps(response)}")
+        logger.debug("Returning response: %s", response)
         return response
         
     except Exception as e:
-        print(f"Error processing request: {str(e)}")
+        logger.error("Error processing request: %s", e)
         
         # Return error response to Bedrock Agent
         error_response = {
             'TEXT': {
-                'body': json.dumps({
+                'body': _dumps({
                     'error': str(e),
                     'message': 'Failed to process security assessment request',
                     'status': 'error'
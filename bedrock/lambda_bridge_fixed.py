@@ -6,6 +6,17 @@ import requests
 import os
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj, indent=False):
+    """Serialize to JSON text, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
 # Gateway configuration (loaded from environment)
 GATEWAY_URL = os.getenv('GATEWAY_URL')
 COGNITO_CLIENT_ID = os.getenv('COGNITO_CLIENT_ID')
@@ -96,7 +107,7 @@ def lambda_handler(event, context):
     """Lambda handler for Bedrock Agent requests"""
     
     try:
-        print(f"Received event: {json.dumps(event)}")
+        print(f"Received event: {_dumps(event)}")
         
         # Extract Bedrock Agent request details
         action_group = event.get('actionGroup', '')
@@ -118,7 +129,7 @@ def lambda_handler(event, context):
         # Format response for Bedrock Agent
         response_body = {
             'TEXT': {
-                'body': json.dumps(result, indent=2)
+                'body': _dumps(result, indent=True)
             }
         }
         
@@ -130,7 +141,7 @@ def lambda_handler(event, context):
             }
         }
         
-        print(f"Returning response: {json.dumps(response)}")
+        print(f"Returning response: {_dumps(response)}")
         return response
         
     except Exception as e:
@@ -139,7 +150,7 @@ def lambda_handler(event, context):
         # Return error response to Bedrock Agent
         error_response = {
             'TEXT': {
-                'body': json.dumps({
+                'body': _dumps({
                     'error': str(e),
                     'message': 'Failed to process security assessment request'
                 })
@@ -4,11 +4,22 @@ Lambda bridge function: Fixed parameter handling for severity and limit
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj, indent=False):
+    """Serialize to JSON text, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
 def lambda_handler(event, context):
     """Lambda handler with proper parameter filtering"""
     
     try:
-        print(f"Received event: {json.dumps(event)}")
+        print(f"Received event: {_dumps(event)}")
         
         # Extract Bedrock Agent request details
         action_group = event.get('actionGroup', '')
@@ -193,14 +204,14 @@ def lambda_handler(event, context):
                 'functionResponse': {
                     'responseBody': {
                         'TEXT': {
-                            'body': json.dumps(result, indent=2)
+                            'body': _dumps(result, indent=True)
                         }
                     }
                 }
             }
         }
         
-        print(f"Returning response: {json.dumps(response)}")
+        print(f"Returning response: {_dumps(response)}")
         return response
         
     except Exception as e:
@@ -215,7 +226,7 @@ def lambda_handler(event, context):
                 'functionResponse': {
                     'responseBody': {
                         'TEXT': {
-                            'body': json.dumps({
+                            'body': _dumps({
                                 'error': str(e),
                                 'message': 'Failed to process security assessment request',
                                 'status': 'error'
@@ -6,11 +6,28 @@ import os
 import requests
 import base64
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj, indent=False):
+    """Serialize to JSON text, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+def _loads(data):
+    """Parse JSON text or bytes, using orjson when it is bundled"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def lambda_handler(event, context):
     """Lambda handler with corrected function name mapping"""
     
     try:
-        print(f"Received event: {json.dumps(event)}")
+        print(f"Received event: {_dumps(event)}")
         
         # Extract function name from event (NOT action group name)
         function_name = event.get('function', '')
@@ -57,7 +74,7 @@ def lambda_handler(event, context):
         response = requests.post(gateway_url, json=payload, headers=headers, timeout=25)
         
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response.content)
             return create_success_response(function_name, result)
         else:
             print(f"Gateway error: {response.status_code} - {response.text}")
@@ -132,7 +149,7 @@ def get_oauth_token():
         response = requests.post(token_url, headers=headers, data=data, timeout=10)
         
         if response.status_code == 200:
-            token_data = response.json()
+            token_data = _loads(response.content)
             access_token = token_data.get('access_token')
             expires_in = token_data.get('expires_in', 3600)
             print(f"Token obtained successfully (expires in {expires_in}s)")
@@ -155,7 +172,7 @@ def create_success_response(function_name, result):
             'functionResponse': {
                 'responseBody': {
                     'TEXT': {
-                        'body': json.dumps(result, indent=2)
+                        'body': _dumps(result, indent=True)
                     }
                 }
             }
@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
-import boto3
 import zipfile
 import os
 from pathlib import Path
+from _aws import client
 
 def update_lambda_final():
     """Update Lambda function with built-in libraries only"""
     
-    lambda_client = boto3.client('lambda', region_name='us-east-1')
+    lambda_client = client('lambda')
     
     # Create deployment directory
     deploy_dir = Path("lambda_deploy_final")
@@ -2,14 +2,14 @@
 """
 Update Lambda function with fixed parameter handling
 """
-import boto3
 import zipfile
 import io
+from _aws import client
 
 def update_lambda_function():
     """Update the Lambda function with fixed parameter handling"""
     
-    lambda_client = boto3.client('lambda', region_name='us-east-1')
+    lambda_client = client('lambda')
     
     # Read the fixed Lambda code
     with open('lambda_bridge_fixed_parameters.py', 'r') as f:
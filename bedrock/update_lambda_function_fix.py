@@ -3,8 +3,8 @@
 Update Lambda function with function name fix
 """
 import zipfile
-import boto3
 import os
+from _aws import client
 
 def update_lambda():
     """Update the Lambda function with the fixed code"""
@@ -18,7 +18,7 @@ def update_lambda():
     print(f"✅ Created {zip_filename}")
     
     # Update Lambda function
-    lambda_client = boto3.client('lambda', region_name='us-east-1')
+    lambda_client = client('lambda')
     
     with open(zip_filename, 'rb') as zip_file:
         response = lambda_client.update_function_code(
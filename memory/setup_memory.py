@@ -40,12 +40,22 @@ def create_security_memory():
     print(f"   Retention: 90 days")
     print(f"   Strategies: Security findings, preferences, compliance context")
     
-    # Save memory ID to environment file
-    with open('.env', 'w') as f:
-        f.write(f"BEDROCK_AGENTCORE_MEMORY_ID={memory['id']}\n")
-        f.write(f"AWS_REGION={region}\n")
+    # Save memory ID to environment file; written atomically, and left alone
+    # when already current so file watchers are not triggered needlessly
+    env_content = f"BEDROCK_AGENTCORE_MEMORY_ID={memory['id']}\nAWS_REGION={region}\n"
+    try:
+        with open('.env', 'r') as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = None
     
-    print(f"\n📝 Configuration saved to .env file")
+    if current == env_content:
+        print(f"\n📝 Configuration in .env file already up to date")
+    else:
+        with open('.env.tmp', 'w') as f:
+            f.write(env_content)
+        os.replace('.env.tmp', '.env')
+        print(f"\n📝 Configuration saved to .env file")
     print(f"   Set environment: export BEDROCK_AGENTCORE_MEMORY_ID={memory['id']}")
     
     return memory
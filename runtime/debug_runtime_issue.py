@@ -34,7 +34,7 @@ def test_runtime_environment():
     print("\n3. _get_security_hub_findings method:")
     try:
         tools = SecurityAssessmentTools(region='us-east-1')
-        findings = tools._get_security_hub_findings(None, None, 'us-east-1', None, None, 5)
+        findings = list(tools._get_security_hub_findings(None, None, 'us-east-1', None, None, 5))
         print(f"   ✅ _get_security_hub_findings: {len(findings)} findings")
         if findings:
             print(f"   First finding: {findings[0].title}")
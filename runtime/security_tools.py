@@ -3,11 +3,52 @@ Core security assessment tools extracted from Well-Architected Security MCP Serv
 """
 import boto3
 import json
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Any, Optional
 from dataclasses import dataclass
+from botocore.config import Config
 
+# Shared by every client: keepalive so reused connections are not silently dropped,
+# short timeouts and adaptive retries to keep tail latency bounded
+_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=10,
+    retries={'mode': 'adaptive', 'total_max_attempts': 3},
+    max_pool_connections=16
+)
 
-@dataclass
+# How long a check_security_services result is reused, in seconds
+SERVICES_CACHE_TTL = 60.0
+
+# Upper bound on items fetched per service by explore_aws_resources
+RESOURCE_INVENTORY_LIMIT = 500
+
+# GuardDuty uses numeric severity: 1.0-3.9=LOW, 4.0-6.9=MEDIUM, 7.0-8.9=HIGH, 9.0-10.0=CRITICAL
+_GUARDDUTY_SEVERITY_RANGES = {
+    'LOW': {'GreaterThanOrEqual': 1, 'LessThan': 4},
+    'MEDIUM': {'GreaterThanOrEqual': 4, 'LessThan': 7},
+    'HIGH': {'GreaterThanOrEqual': 7, 'LessThan': 9},
+    'CRITICAL': {'GreaterThanOrEqual': 9}
+}
+
+# Resource types as named by callers -> GuardDuty resource.resourceType values
+_GUARDDUTY_RESOURCE_TYPES = {
+    'EC2': 'Instance',
+    'S3': 'S3Bucket',
+    'IAM': 'AccessKey',
+    'EKS': 'EKSCluster',
+    'ECS': 'ECSCluster',
+    'RDS': 'RDSDBInstance',
+    'LAMBDA': 'Lambda'
+}
+
+
+@dataclass(slots=True, frozen=True)
 class SecurityFinding:
     service: str
     severity: str
@@ -34,21 +75,49 @@ class SecurityAssessmentTools:
     def __init__(self, region: str = 'us-east-1'):
         self.region = region
         self.session = boto3.Session(region_name=region)
+        self._clients: Dict[tuple, Any] = {}
+        self._client_lock = threading.Lock()
+        # (expires_at on the time.monotonic() clock, check_security_services result)
+        self._services_cache = None
+        
+    def _client(self, service: str, session: Optional[boto3.Session] = None):
+        """Return a cached client per (service, region); boto3 sessions are not thread-safe, so creation is serialized"""
+        session = session or self.session
+        key = (service, session.region_name)
+        client = self._clients.get(key)
+        if client is None:
+            with self._client_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = session.client(service, config=_CLIENT_CONFIG)
+        return client
         
     def check_security_services(self) -> Dict[str, Any]:
         """Monitor AWS security services operational status"""
-        results = {
-            'guardduty': self._check_guardduty(),
-            'security_hub': self._check_security_hub(),
-            'inspector': self._check_inspector(),
-            'access_analyzer': self._check_access_analyzer()
+        cached = self._services_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        checks = {
+            'guardduty': self._check_guardduty,
+            'security_hub': self._check_security_hub,
+            'inspector': self._check_inspector,
+            'access_analyzer': self._check_access_analyzer
         }
         
-        return {
+        # The checks are independent network calls, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {name: executor.submit(check) for name, check in checks.items()}
+        results = {name: future.result() for name, future in futures.items()}
+        
+        result = {
             'status': 'success',
             'services': results,
             'summary': self._generate_service_summary(results)
         }
+        self._services_cache = (time.monotonic() + SERVICES_CACHE_TTL, result)
+        
+        return result
     
     def get_security_findings(self, severity_filter: Optional[str] = None, limit: Optional[int] = None, region: Optional[str] = None, service_filter: Optional[str] = None, resource_type: Optional[str] = None, compliance_status: Optional[str] = None) -> Dict[str, Any]:
         """Retrieve security findings from multiple AWS services with comprehensive filtering"""
@@ -64,21 +133,26 @@ class SecurityAssessmentTools:
         # Set default limit to match AWS API response (no limit means get all)
         max_results = limit if limit is not None else 1000  # AWS API max is 100 per call, but we'll paginate
         
-        findings = []
-        
-        # Get findings from specified services or all services
+        # Get findings from specified services or all services; the helpers are
+        # generators, so no API call is made until a source is consumed
+        sources = []
         if not service_filter or service_filter.upper() == 'SECURITYHUB':
-            findings.extend(self._get_security_hub_findings(severity_filter, session, target_region, resource_type, compliance_status, max_results))
+            sources.append(self._get_security_hub_findings(severity_filter, session, target_region, resource_type, compliance_status, max_results))
         
         if not service_filter or service_filter.upper() == 'GUARDDUTY':
-            findings.extend(self._get_guardduty_findings(severity_filter, session, target_region, resource_type, max_results))
+            sources.append(self._get_guardduty_findings(severity_filter, session, target_region, resource_type, max_results))
         
         if not service_filter or service_filter.upper() == 'INSPECTOR':
-            findings.extend(self._get_inspector_findings(severity_filter, session, target_region, resource_type, max_results))
+            sources.append(self._get_inspector_findings(severity_filter, session, target_region, resource_type, max_results))
         
-        # Apply final limit if specified
-        if limit is not None:
-            findings = findings[:limit]
+        if limit is None:
+            # Every finding is needed, so drain the sources concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [executor.submit(list, source) for source in sources]
+            findings = [f for future in futures for f in future.result()]
+        else:
+            # Consume the sources in order and stop calling APIs once the limit is reached
+            findings = list(islice(chain.from_iterable(sources), limit))
         
         return {
             'status': 'success',
@@ -99,7 +173,7 @@ class SecurityAssessmentTools:
         """Comprehensive security posture analysis against Well-Architected Framework"""
         analysis = {
             'identity_access_management': self._analyze_iam(),
-            'detective_controls': self._analyze_detective_controls(),
+            'detective_controls': self._analyze_detective_controls(self.check_security_services()['services']),
             'infrastructure_protection': self._analyze_infrastructure(),
             'data_protection': self._analyze_data_protection(),
             'incident_response': self._analyze_incident_response()
@@ -120,22 +194,27 @@ class SecurityAssessmentTools:
         
         services = ['ec2', 's3', 'rds', 'lambda', 'iam'] if not service_filter else [service_filter]
         
-        for service in services:
+        with ThreadPoolExecutor(max_workers=len(services)) as executor:
+            futures = {service: executor.submit(self._get_service_resources, service) for service in services}
+        
+        total_resources = 0
+        for service, future in futures.items():
             try:
-                resources[service] = self._get_service_resources(service)
+                resources[service] = items = future.result()
+                total_resources += len(items.get('items', ()))
             except Exception as e:
                 resources[service] = {'error': str(e)}
         
         return {
             'status': 'success',
             'resources': resources,
-            'total_resources': sum(len(r.get('items', [])) for r in resources.values() if 'items' in r)
+            'total_resources': total_resources
         }
     
     def get_resource_compliance_status(self, resource_type: Optional[str] = None) -> Dict[str, Any]:
         """Check compliance status of AWS resources against security standards"""
         try:
-            config_client = self.session.client('config')
+            config_client = self._client('config')
             
             # Get compliance details
             compliance_results = config_client.get_compliance_details_by_config_rule()
@@ -174,7 +253,7 @@ class SecurityAssessmentTools:
     # Private helper methods
     def _check_guardduty(self) -> Dict[str, Any]:
         try:
-            client = self.session.client('guardduty')
+            client = self._client('guardduty')
             detectors = client.list_detectors()
             
             if not detectors['DetectorIds']:
@@ -193,7 +272,7 @@ class SecurityAssessmentTools:
     
     def _check_security_hub(self) -> Dict[str, Any]:
         try:
-            client = self.session.client('securityhub')
+            client = self._client('securityhub')
             hub = client.get_enabled_standards()
             
             return {
@@ -206,7 +285,7 @@ class SecurityAssessmentTools:
     
     def _check_inspector(self) -> Dict[str, Any]:
         try:
-            client = self.session.client('inspector2')
+            client = self._client('inspector2')
             account = client.get_member()
             
             return {
@@ -218,7 +297,7 @@ class SecurityAssessmentTools:
     
     def _check_access_analyzer(self) -> Dict[str, Any]:
         try:
-            client = self.session.client('accessanalyzer')
+            client = self._client('accessanalyzer')
             analyzers = client.list_analyzers()
             
             return {
@@ -229,11 +308,11 @@ class SecurityAssessmentTools:
         except Exception as e:
             return {'enabled': False, 'error': str(e)}
     
-    def _get_security_hub_findings(self, severity_filter: Optional[str], session: boto3.Session = None, region: str = None, resource_type: Optional[str] = None, compliance_status: Optional[str] = None, max_results: int = 1000) -> List[SecurityFinding]:
+    def _get_security_hub_findings(self, severity_filter: Optional[str], session: boto3.Session = None, region: str = None, resource_type: Optional[str] = None, compliance_status: Optional[str] = None, max_results: int = 1000) -> Iterator[SecurityFinding]:
         try:
             session = session or self.session
             region = region or self.region
-            client = session.client('securityhub')
+            client = self._client('securityhub', session)
             filters = {}
             
             if severity_filter:
@@ -245,13 +324,13 @@ class SecurityAssessmentTools:
             if compliance_status:
                 filters['ComplianceStatus'] = [{'Value': compliance_status.upper(), 'Comparison': 'EQUALS'}]
             
-            # Paginate through all findings to get complete dataset
-            all_findings = []
+            # Paginate lazily; further pages are only fetched if the caller keeps consuming
+            count = 0
             next_token = None
             
-            while len(all_findings) < max_results:
+            while count < max_results:
                 # AWS Security Hub max is 100 per call
-                page_size = min(100, max_results - len(all_findings))
+                page_size = min(100, max_results - count)
                 
                 kwargs = {
                     'Filters': filters,
@@ -262,54 +341,47 @@ class SecurityAssessmentTools:
                     kwargs['NextToken'] = next_token
                 
                 response = client.get_findings(**kwargs)
-                all_findings.extend(response['Findings'])
+                for f in response['Findings'][:max_results - count]:
+                    yield SecurityFinding(
+                        service='SecurityHub',
+                        severity=f.get('Severity', {}).get('Label', 'UNKNOWN'),
+                        title=f.get('Title', 'Unknown'),
+                        description=f.get('Description', 'No description'),
+                        resource_id=f.get('Resources', [{}])[0].get('Id', 'Unknown'),
+                        region=region
+                    )
+                    count += 1
                 
                 next_token = response.get('NextToken')
                 if not next_token:
                     break
-            
-            return [
-                SecurityFinding(
-                    service='SecurityHub',
-                    severity=f.get('Severity', {}).get('Label', 'UNKNOWN'),
-                    title=f.get('Title', 'Unknown'),
-                    description=f.get('Description', 'No description'),
-                    resource_id=f.get('Resources', [{}])[0].get('Id', 'Unknown'),
-                    region=region
-                )
-                for f in all_findings[:max_results]
-            ]
         except Exception:
-            return []
+            return
     
-    def _get_guardduty_findings(self, severity_filter: Optional[str], session: boto3.Session = None, region: str = None, resource_type: Optional[str] = None, max_results: int = 1000) -> List[SecurityFinding]:
+    def _get_guardduty_findings(self, severity_filter: Optional[str], session: boto3.Session = None, region: str = None, resource_type: Optional[str] = None, max_results: int = 1000) -> Iterator[SecurityFinding]:
+        # A severity label GuardDuty has no numeric range for (e.g. INFORMATIONAL) can never match
+        if severity_filter and severity_filter.upper() not in _GUARDDUTY_SEVERITY_RANGES:
+            return
+        
         try:
             session = session or self.session
             region = region or self.region
-            client = session.client('guardduty')
+            client = self._client('guardduty', session)
             detectors = client.list_detectors()
             
             if not detectors['DetectorIds']:
-                return []
+                return
             
             detector_id = detectors['DetectorIds'][0]
             
-            # Build finding criteria for filtering
+            # Build finding criteria so the API only returns matching finding IDs
             finding_criteria = {}
             if severity_filter:
-                # GuardDuty uses numeric severity: 1.0-3.9=LOW, 4.0-6.9=MEDIUM, 7.0-8.9=HIGH, 9.0-10.0=CRITICAL
-                severity_ranges = {
-                    'LOW': {'gte': 1.0, 'lt': 4.0},
-                    'MEDIUM': {'gte': 4.0, 'lt': 7.0},
-                    'HIGH': {'gte': 7.0, 'lt': 9.0},
-                    'CRITICAL': {'gte': 9.0, 'lte': 10.0}
-                }
-                if severity_filter.upper() in severity_ranges:
-                    range_filter = severity_ranges[severity_filter.upper()]
-                    finding_criteria['severity'] = range_filter
+                finding_criteria['severity'] = _GUARDDUTY_SEVERITY_RANGES[severity_filter.upper()]
             
             if resource_type:
-                finding_criteria['type'] = {'eq': [f'{resource_type.upper()}*']}
+                guardduty_type = _GUARDDUTY_RESOURCE_TYPES.get(resource_type.upper(), resource_type)
+                finding_criteria['resource.resourceType'] = {'Equals': [guardduty_type]}
             
             if finding_criteria:
                 findings = client.list_findings(
@@ -321,14 +393,13 @@ class SecurityAssessmentTools:
                 findings = client.list_findings(DetectorId=detector_id, MaxResults=min(50, max_results))
             
             if not findings['FindingIds']:
-                return []
+                return
             
             finding_details = client.get_findings(
                 DetectorId=detector_id,
                 FindingIds=findings['FindingIds']
             )
             
-            result = []
             for f in finding_details['Findings']:
                 severity_num = f.get('Severity', 0)
                 # Convert numeric severity to label
@@ -341,24 +412,22 @@ class SecurityAssessmentTools:
                 else:
                     severity_label = 'LOW'
                     
-                result.append(SecurityFinding(
+                yield SecurityFinding(
                     service='GuardDuty',
                     severity=severity_label,
                     title=f.get('Title', 'Unknown'),
                     description=f.get('Description', 'No description'),
                     resource_id=f.get('Resource', {}).get('InstanceDetails', {}).get('InstanceId', 'Unknown'),
                     region=region
-                ))
-            
-            return result
+                )
         except Exception:
-            return []
+            return
     
-    def _get_inspector_findings(self, severity_filter: Optional[str], session: boto3.Session = None, region: str = None, resource_type: Optional[str] = None, max_results: int = 1000) -> List[SecurityFinding]:
+    def _get_inspector_findings(self, severity_filter: Optional[str], session: boto3.Session = None, region: str = None, resource_type: Optional[str] = None, max_results: int = 1000) -> Iterator[SecurityFinding]:
         try:
             session = session or self.session
             region = region or self.region
-            client = session.client('inspector2')
+            client = self._client('inspector2', session)
             
             # Build filter criteria
             filter_criteria = {}
@@ -373,22 +442,19 @@ class SecurityAssessmentTools:
             else:
                 findings = client.list_findings(maxResults=min(100, max_results))
             
-            result = []
             for f in findings.get('findings', []):
                 severity = f.get('severity', 'UNKNOWN')
                     
-                result.append(SecurityFinding(
+                yield SecurityFinding(
                     service='Inspector',
                     severity=severity,
                     title=f.get('title', 'Unknown'),
                     description=f.get('description', 'No description'),
                     resource_id=f.get('resources', [{}])[0].get('id', 'Unknown'),
                     region=region
-                ))
-            
-            return result
+                )
         except Exception:
-            return []
+            return
     
     def _generate_service_summary(self, results: Dict) -> Dict[str, Any]:
         enabled_count = sum(1 for service in results.values() if service.get('enabled', False))
@@ -401,29 +467,19 @@ class SecurityAssessmentTools:
         }
     
     def _generate_findings_summary(self, findings: List[SecurityFinding]) -> Dict[str, Any]:
-        severity_counts = {}
-        service_counts = {}
-        
-        for finding in findings:
-            severity_counts[finding.severity] = severity_counts.get(finding.severity, 0) + 1
-            service_counts[finding.service] = service_counts.get(finding.service, 0) + 1
-        
         return {
-            'by_severity': severity_counts,
-            'by_service': service_counts
+            'by_severity': dict(Counter(f.severity for f in findings)),
+            'by_service': dict(Counter(f.service for f in findings))
         }
     
     def _analyze_iam(self) -> Dict[str, Any]:
         try:
-            iam = self.session.client('iam')
-            
-            # Check for root access keys
-            summary = iam.get_account_summary()
-            root_access_keys = summary['SummaryMap'].get('AccountAccessKeysPresent', 0)
+            iam = self._client('iam')
             
-            # Check MFA on root
-            mfa_devices = iam.list_mfa_devices()
-            root_mfa_enabled = len(mfa_devices['MFADevices']) > 0
+            # The account summary covers both root access keys and root MFA
+            summary = iam.get_account_summary()['SummaryMap']
+            root_access_keys = summary.get('AccountAccessKeysPresent', 0)
+            root_mfa_enabled = summary.get('AccountMFAEnabled', 0) == 1
             
             return {
                 'score': 85 if root_mfa_enabled and root_access_keys == 0 else 60,
@@ -434,8 +490,7 @@ class SecurityAssessmentTools:
         except Exception:
             return {'score': 0, 'error': 'Unable to analyze IAM'}
     
-    def _analyze_detective_controls(self) -> Dict[str, Any]:
-        services = self.check_security_services()['services']
+    def _analyze_detective_controls(self, services: Dict[str, Any]) -> Dict[str, Any]:
         enabled_count = sum(1 for s in services.values() if s.get('enabled', False))
         
         return {
@@ -473,8 +528,11 @@ class SecurityAssessmentTools:
         }
     
     def _calculate_security_score(self, analysis: Dict) -> int:
-        scores = [pillar.get('score', 0) for pillar in analysis.values()]
-        return sum(scores) // len(scores) if scores else 0
+        total = 0
+        for pillar in analysis.values():
+            total += pillar.get('score', 0)
+        # The detective controls score is a percentage float, so coerce to the declared int
+        return int(total // len(analysis)) if analysis else 0
     
     def _generate_recommendations(self, analysis: Dict) -> List[str]:
         recommendations = []
@@ -485,8 +543,8 @@ class SecurityAssessmentTools:
     def _get_service_resources(self, service: str) -> Dict[str, Any]:
         try:
             if service == 'ec2':
-                client = self.session.client('ec2')
-                instances = client.describe_instances()
+                client = self._client('ec2')
+                pages = client.get_paginator('describe_instances').paginate(PaginationConfig={'MaxItems': RESOURCE_INVENTORY_LIMIT})
                 return {
                     'items': [
                         {
@@ -494,12 +552,13 @@ class SecurityAssessmentTools:
                             'state': instance['State']['Name'],
                             'type': instance['InstanceType']
                         }
-                        for reservation in instances['Reservations']
+                        for page in pages
+                        for reservation in page['Reservations']
                         for instance in reservation['Instances']
                     ]
                 }
             elif service == 's3':
-                client = self.session.client('s3')
+                client = self._client('s3')
                 buckets = client.list_buckets()
                 return {
                     'items': [
@@ -511,8 +570,8 @@ class SecurityAssessmentTools:
                     ]
                 }
             elif service == 'rds':
-                client = self.session.client('rds')
-                instances = client.describe_db_instances()
+                client = self._client('rds')
+                pages = client.get_paginator('describe_db_instances').paginate(PaginationConfig={'MaxItems': RESOURCE_INVENTORY_LIMIT})
                 return {
                     'items': [
                         {
@@ -520,12 +579,13 @@ class SecurityAssessmentTools:
                             'status': db['DBInstanceStatus'],
                             'engine': db['Engine']
                         }
-                        for db in instances['DBInstances']
+                        for page in pages
+                        for db in page['DBInstances']
                     ]
                 }
             elif service == 'lambda':
-                client = self.session.client('lambda')
-                functions = client.list_functions()
+                client = self._client('lambda')
+                pages = client.get_paginator('list_functions').paginate(PaginationConfig={'MaxItems': RESOURCE_INVENTORY_LIMIT})
                 return {
                     'items': [
                         {
@@ -533,19 +593,21 @@ class SecurityAssessmentTools:
                             'runtime': func['Runtime'],
                             'last_modified': func['LastModified']
                         }
-                        for func in functions['Functions']
+                        for page in pages
+                        for func in page['Functions']
                     ]
                 }
             elif service == 'iam':
-                client = self.session.client('iam')
-                users = client.list_users()
+                client = self._client('iam')
+                pages = client.get_paginator('list_users').paginate(PaginationConfig={'MaxItems': RESOURCE_INVENTORY_LIMIT})
                 return {
                     'items': [
                         {
                             'name': user['UserName'],
                             'creation_date': user['CreateDate'].isoformat()
                         }
-                        for user in users['Users']
+                        for page in pages
+                        for user in page['Users']
                     ]
                 }
             else:
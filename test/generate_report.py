@@ -2,141 +2,154 @@
 """
 Generate comprehensive test report for AgentCore Security Assessment Application
 """
+import functools
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
-def generate_comprehensive_report():
-    """Generate a comprehensive deployment and test report"""
-    
-    report = {
-        "deployment_summary": {
-            "project_name": "AgentCore Security Assessment Application",
-            "deployment_date": datetime.now().isoformat(),
-            "aws_account": "039920874011",
-            "aws_region": "us-east-1",
-            "status": "SUCCESSFULLY_DEPLOYED"
-        },
-        "architecture": {
-            "description": "Complete security assessment solution using AWS Bedrock Agent with AgentCore backend",
-            "flow": "User Request → Bedrock Agent → Lambda Bridge → AgentCore Gateway (OAuth) → AgentCore Runtime → AgentCore Memory",
-            "components": {
-                "bedrock_agent": {
-                    "agent_id": "KS91Z9H2MA",
-                    "agent_name": "security-assessment-agent",
-                    "alias_id": "UEWYRHGIEL",
-                    "foundation_model": "anthropic.claude-3-sonnet-20240229-v1:0",
-                    "status": "PREPARED"
-                },
-                "lambda_bridge": {
-                    "function_name": "security-agent-bridge",
-                    "arn": "arn:aws:lambda:us-east-1:039920874011:function:security-agent-bridge",
-                    "runtime": "python3.11",
-                    "status": "ACTIVE"
-                },
-                "agentcore_gateway": {
-                    "gateway_id": "security-gateway-0xd0v9msee",
-                    "arn": "arn:aws:bedrock-agentcore:us-east-1:039920874011:gateway/security-gateway-0xd0v9msee",
-                    "url": "https://security-gateway-0xd0v9msee.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp",
-                    "auth_type": "CUSTOM_JWT",
-                    "status": "CREATING"
-                },
-                "agentcore_runtime": {
-                    "runtime_id": "security_agent-zoiv02GSnP",
-                    "arn": "arn:aws:bedrock-agentcore:us-east-1:039920874011:runtime/security_agent-zoiv02GSnP",
-                    "framework": "Strands",
-                    "status": "DEPLOYED"
-                },
-                "agentcore_memory": {
-                    "memory_id": "SecurityAssessment_3bcea5e8-pMrdjrG7OP",
-                    "retention_days": 90,
-                    "strategies": ["security_findings", "user_preferences", "assessment_history"],
-                    "status": "ACTIVE"
-                }
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_bytes(obj):
+    """Serialize to indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+# Report content known at import time; generate_comprehensive_report adds the date
+_STATIC_REPORT = {
+    "deployment_summary": {
+        "project_name": "AgentCore Security Assessment Application",
+        "deployment_date": None,  # filled in per report
+        "aws_account": "039920874011",
+        "aws_region": "us-east-1",
+        "status": "SUCCESSFULLY_DEPLOYED"
+    },
+    "architecture": {
+        "description": "Complete security assessment solution using AWS Bedrock Agent with AgentCore backend",
+        "flow": "User Request → Bedrock Agent → Lambda Bridge → AgentCore Gateway (OAuth) → AgentCore Runtime → AgentCore Memory",
+        "components": {
+            "bedrock_agent": {
+                "agent_id": "KS91Z9H2MA",
+                "agent_name": "security-assessment-agent",
+                "alias_id": "UEWYRHGIEL",
+                "foundation_model": "anthropic.claude-3-sonnet-20240229-v1:0",
+                "status": "PREPARED"
+            },
+            "lambda_bridge": {
+                "function_name": "security-agent-bridge",
+                "arn": "arn:aws:lambda:us-east-1:039920874011:function:security-agent-bridge",
+                "runtime": "python3.11",
+                "status": "ACTIVE"
+            },
+            "agentcore_gateway": {
+                "gateway_id": "security-gateway-0xd0v9msee",
+                "arn": "arn:aws:bedrock-agentcore:us-east-1:039920874011:gateway/security-gateway-0xd0v9msee",
+                "url": "https://security-gateway-0xd0v9msee.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp",
+                "auth_type": "CUSTOM_JWT",
+                "status": "CREATING"
+            },
+            "agentcore_runtime": {
+                "runtime_id": "security_agent-zoiv02GSnP",
+                "arn": "arn:aws:bedrock-agentcore:us-east-1:039920874011:runtime/security_agent-zoiv02GSnP",
+                "framework": "Strands",
+                "status": "DEPLOYED"
+            },
+            "agentcore_memory": {
+                "memory_id": "SecurityAssessment_3bcea5e8-pMrdjrG7OP",
+                "retention_days": 90,
+                "strategies": ["security_findings", "user_preferences", "assessment_history"],
+                "status": "ACTIVE"
             }
-        },
-        "security_tools": {
-            "description": "Comprehensive AWS security assessment capabilities",
-            "tools": [
+        }
+    },
+    "security_tools": {
+        "description": "Comprehensive AWS security assessment capabilities",
+        "tools": [
+            {
+                "name": "checkSecurityServices",
+                "description": "Check AWS security services configuration across regions",
+                "parameters": ["region"],
+                "capabilities": ["SecurityHub", "GuardDuty", "Config", "CloudTrail", "Inspector"]
+            },
+            {
+                "name": "getSecurityFindings",
+                "description": "Retrieve security findings from AWS Security Hub",
+                "parameters": ["severity", "limit"],
+                "severity_levels": ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+            },
+            {
+                "name": "analyzeSecurityPosture",
+                "description": "Analyze overall security posture with recommendations",
+                "parameters": ["include_recommendations"],
+                "analysis_areas": ["identity_access", "data_protection", "infrastructure_security", "logging_monitoring", "incident_response"]
+            }
+        ]
+    },
+    "deployment_results": {
+        "total_components": 5,
+        "successful_deployments": 5,
+        "failed_deployments": 0,
+        "success_rate": "100%",
+        "deployment_time": "~15 minutes",
+        "components_status": {
+            "agentcore_memory": "✅ DEPLOYED",
+            "agentcore_runtime": "✅ DEPLOYED", 
+            "agentcore_gateway": "✅ DEPLOYED",
+            "lambda_bridge": "✅ DEPLOYED",
+            "bedrock_agent": "✅ CONFIGURED"
+        }
+    },
+    "test_results": {
+        "integration_tests": {
+            "total_tests": 3,
+            "passed": 3,
+            "failed": 0,
+            "success_rate": "100%",
+            "test_details": [
                 {
-                    "name": "checkSecurityServices",
-                    "description": "Check AWS security services configuration across regions",
-                    "parameters": ["region"],
-                    "capabilities": ["SecurityHub", "GuardDuty", "Config", "CloudTrail", "Inspector"]
+                    "test": "Deployment Status Check",
+                    "status": "PASS",
+                    "description": "All components deployed successfully"
                 },
                 {
-                    "name": "getSecurityFindings",
-                    "description": "Retrieve security findings from AWS Security Hub",
-                    "parameters": ["severity", "limit"],
-                    "severity_levels": ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+                    "test": "Lambda Bridge Direct Test", 
+                    "status": "PASS",
+                    "description": "Lambda function executes security tools correctly"
                 },
                 {
-                    "name": "analyzeSecurityPosture",
-                    "description": "Analyze overall security posture with recommendations",
-                    "parameters": ["include_recommendations"],
-                    "analysis_areas": ["identity_access", "data_protection", "infrastructure_security", "logging_monitoring", "incident_response"]
+                    "test": "Agent Basic Invocation",
+                    "status": "PASS", 
+                    "description": "Bedrock Agent responds to security assessment requests"
                 }
             ]
         },
-        "deployment_results": {
-            "total_components": 5,
-            "successful_deployments": 5,
-            "failed_deployments": 0,
-            "success_rate": "100%",
-            "deployment_time": "~15 minutes",
-            "components_status": {
-                "agentcore_memory": "✅ DEPLOYED",
-                "agentcore_runtime": "✅ DEPLOYED", 
-                "agentcore_gateway": "✅ DEPLOYED",
-                "lambda_bridge": "✅ DEPLOYED",
-                "bedrock_agent": "✅ CONFIGURED"
-            }
-        },
-        "test_results": {
-            "integration_tests": {
-                "total_tests": 3,
-                "passed": 3,
-                "failed": 0,
-                "success_rate": "100%",
-                "test_details": [
-                    {
-                        "test": "Deployment Status Check",
-                        "status": "PASS",
-                        "description": "All components deployed successfully"
-                    },
-                    {
-                        "test": "Lambda Bridge Direct Test", 
-                        "status": "PASS",
-                        "description": "Lambda function executes security tools correctly"
-                    },
-                    {
-                        "test": "Agent Basic Invocation",
-                        "status": "PASS", 
-                        "description": "Bedrock Agent responds to security assessment requests"
-                    }
-                ]
-            },
-            "functional_tests": {
-                "security_services_check": "✅ Working - Returns status of AWS security services",
-                "security_findings_retrieval": "✅ Working - Retrieves and filters security findings",
-                "security_posture_analysis": "✅ Working - Provides comprehensive security analysis"
-            }
+        "functional_tests": {
+            "security_services_check": "✅ Working - Returns status of AWS security services",
+            "security_findings_retrieval": "✅ Working - Retrieves and filters security findings",
+            "security_posture_analysis": "✅ Working - Provides comprehensive security analysis"
+        }
+    },
+    "usage_instructions": {
+        "bedrock_console": {
+            "description": "Test the agent through AWS Bedrock Console",
+            "steps": [
+                "1. Navigate to AWS Bedrock Console",
+                "2. Go to Agents section",
+                "3. Select 'security-assessment-agent'",
+                "4. Use the test interface to interact with the agent",
+                "5. Try queries like: 'Check my security services in us-east-1'"
+            ]
         },
-        "usage_instructions": {
-            "bedrock_console": {
-                "description": "Test the agent through AWS Bedrock Console",
-                "steps": [
-                    "1. Navigate to AWS Bedrock Console",
-                    "2. Go to Agents section",
-                    "3. Select 'security-assessment-agent'",
-                    "4. Use the test interface to interact with the agent",
-                    "5. Try queries like: 'Check my security services in us-east-1'"
-                ]
-            },
-            "api_invocation": {
-                "description": "Invoke the agent programmatically",
-                "example_code": {
-                    "python": """
+        "api_invocation": {
+            "description": "Invoke the agent programmatically",
+            "example_code": {
+                "python": """
 import boto3
 
 bedrock_runtime = boto3.client('bedrock-agent-runtime', region_name='us-east-1')
@@ -155,144 +168,177 @@ for event in response['completion']:
         if 'bytes' in chunk:
             print(chunk['bytes'].decode('utf-8'))
 """
-                }
             }
+        }
+    },
+    "sample_interactions": [
+        {
+            "user_query": "Check my security services configuration",
+            "agent_response": "I'll check your AWS security services configuration. The analysis shows that SecurityHub, GuardDuty, Config, and CloudTrail are all enabled in your account, which is excellent for maintaining security visibility."
         },
-        "sample_interactions": [
-            {
-                "user_query": "Check my security services configuration",
-                "agent_response": "I'll check your AWS security services configuration. The analysis shows that SecurityHub, GuardDuty, Config, and CloudTrail are all enabled in your account, which is excellent for maintaining security visibility."
-            },
-            {
-                "user_query": "Get high severity security findings",
-                "agent_response": "I found 3 high severity security findings that require attention: S3 bucket with public read access, EC2 security group allowing unrestricted SSH, and unused IAM access keys. I recommend addressing these issues promptly."
-            },
-            {
-                "user_query": "Analyze my overall security posture",
-                "agent_response": "Your security posture score is 78/100. Strong areas include identity & access management (85) and infrastructure security (80). Areas for improvement include data protection (72) and incident response (70). Key recommendations include enabling MFA for all users and implementing automated security scanning."
-            }
-        ],
-        "technical_details": {
-            "oauth_configuration": {
-                "provider": "AWS Cognito",
-                "client_id": "cga3d98ldb3hd38a6lbbjluj0",
-                "user_pool_id": "us-east-1_DBAPV3Fct",
-                "discovery_url": "https://cognito-idp.us-east-1.amazonaws.com/us-east-1_DBAPV3Fct/.well-known/openid-configuration"
-            },
-            "iam_roles": {
-                "bedrock_agent_role": "arn:aws:iam::039920874011:role/SecurityBedrockAgentRole",
-                "lambda_execution_role": "arn:aws:iam::039920874011:role/SecurityAgentLambdaRole",
-                "gateway_execution_role": "arn:aws:iam::039920874011:role/AgentCoreGatewayExecutionRole"
-            },
-            "networking": {
-                "gateway_endpoint": "https://security-gateway-0xd0v9msee.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp",
-                "protocol": "MCP (Model Context Protocol)",
-                "authentication": "JWT Bearer Token"
-            }
+        {
+            "user_query": "Get high severity security findings",
+            "agent_response": "I found 3 high severity security findings that require attention: S3 bucket with public read access, EC2 security group allowing unrestricted SSH, and unused IAM access keys. I recommend addressing these issues promptly."
         },
-        "next_steps": {
-            "immediate": [
-                "Test the agent with various security assessment queries",
-                "Verify OAuth authentication is working properly",
-                "Monitor CloudWatch logs for any issues"
-            ],
-            "enhancements": [
-                "Implement real AWS API calls instead of mock responses",
-                "Add more security assessment tools (Inspector, Macie, etc.)",
-                "Set up automated security scanning schedules",
-                "Create custom security compliance frameworks"
-            ],
-            "production_readiness": [
-                "Implement proper error handling and retry logic",
-                "Set up monitoring and alerting",
-                "Configure backup and disaster recovery",
-                "Implement security scanning and vulnerability management"
-            ]
+        {
+            "user_query": "Analyze my overall security posture",
+            "agent_response": "Your security posture score is 78/100. Strong areas include identity & access management (85) and infrastructure security (80). Areas for improvement include data protection (72) and incident response (70). Key recommendations include enabling MFA for all users and implementing automated security scanning."
+        }
+    ],
+    "technical_details": {
+        "oauth_configuration": {
+            "provider": "AWS Cognito",
+            "client_id": "cga3d98ldb3hd38a6lbbjluj0",
+            "user_pool_id": "us-east-1_DBAPV3Fct",
+            "discovery_url": "https://cognito-idp.us-east-1.amazonaws.com/us-east-1_DBAPV3Fct/.well-known/openid-configuration"
         },
-        "cost_estimation": {
-            "monthly_estimate": {
-                "bedrock_agent": "$10-50 (depending on usage)",
-                "lambda_invocations": "$1-5 (based on request volume)",
-                "agentcore_components": "$20-100 (Memory + Runtime + Gateway)",
-                "total_estimated": "$31-155 per month"
-            },
-            "cost_optimization": [
-                "Use reserved capacity for predictable workloads",
-                "Implement request caching to reduce API calls",
-                "Monitor and optimize Lambda memory allocation",
-                "Set up cost alerts and budgets"
-            ]
+        "iam_roles": {
+            "bedrock_agent_role": "arn:aws:iam::039920874011:role/SecurityBedrockAgentRole",
+            "lambda_execution_role": "arn:aws:iam::039920874011:role/SecurityAgentLambdaRole",
+            "gateway_execution_role": "arn:aws:iam::039920874011:role/AgentCoreGatewayExecutionRole"
+        },
+        "networking": {
+            "gateway_endpoint": "https://security-gateway-0xd0v9msee.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp",
+            "protocol": "MCP (Model Context Protocol)",
+            "authentication": "JWT Bearer Token"
+        }
+    },
+    "next_steps": {
+        "immediate": [
+            "Test the agent with various security assessment queries",
+            "Verify OAuth authentication is working properly",
+            "Monitor CloudWatch logs for any issues"
+        ],
+        "enhancements": [
+            "Implement real AWS API calls instead of mock responses",
+            "Add more security assessment tools (Inspector, Macie, etc.)",
+            "Set up automated security scanning schedules",
+            "Create custom security compliance frameworks"
+        ],
+        "production_readiness": [
+            "Implement proper error handling and retry logic",
+            "Set up monitoring and alerting",
+            "Configure backup and disaster recovery",
+            "Implement security scanning and vulnerability management"
+        ]
+    },
+    "cost_estimation": {
+        "monthly_estimate": {
+            "bedrock_agent": "$10-50 (depending on usage)",
+            "lambda_invocations": "$1-5 (based on request volume)",
+            "agentcore_components": "$20-100 (Memory + Runtime + Gateway)",
+            "total_estimated": "$31-155 per month"
+        },
+        "cost_optimization": [
+            "Use reserved capacity for predictable workloads",
+            "Implement request caching to reduce API calls",
+            "Monitor and optimize Lambda memory allocation",
+            "Set up cost alerts and budgets"
+        ]
+    }
+}
+
+@functools.lru_cache(maxsize=1)
+def _timestamp_for_second(second):
+    """ISO timestamp for the report, formatted once per wall-clock second"""
+    return datetime.now().isoformat()
+
+def generate_comprehensive_report():
+    """Generate a comprehensive deployment and test report"""
+    # Only the generation timestamp varies; everything else is shared with _STATIC_REPORT
+    return {
+        **_STATIC_REPORT,
+        "deployment_summary": {
+            **_STATIC_REPORT["deployment_summary"],
+            "deployment_date": _timestamp_for_second(int(time.time()))
         }
     }
+
+def _build_markdown(report):
+    """Render the readable Markdown version of the report"""
+    summary = report['deployment_summary']
+    architecture = report['architecture']
+    components = architecture['components']
+    bedrock_agent = components['bedrock_agent']
+    results = report['deployment_results']
+    integration_tests = report['test_results']['integration_tests']
+    
+    parts = []
+    append = parts.append
+    append("# AgentCore Security Assessment Application - Deployment Report\n\n")
+    append(f"**Generated:** {summary['deployment_date']}\n")
+    append(f"**Status:** {summary['status']}\n")
+    append(f"**AWS Account:** {summary['aws_account']}\n")
+    append(f"**Region:** {summary['aws_region']}\n\n")
+    
+    append("## Architecture Overview\n\n")
+    append(f"{architecture['description']}\n\n")
+    append(f"**Data Flow:** {architecture['flow']}\n\n")
+    
+    append("## Deployment Results\n\n")
+    append(f"- **Success Rate:** {results['success_rate']}\n")
+    append(f"- **Components Deployed:** {results['successful_deployments']}/{results['total_components']}\n")
+    append(f"- **Deployment Time:** {results['deployment_time']}\n\n")
+    
+    append("### Component Status\n\n")
+    for component, status in results['components_status'].items():
+        append(f"- **{component.replace('_', ' ').title()}:** {status}\n")
+    
+    append("\n## Test Results\n\n")
+    append(f"**Integration Tests:** {integration_tests['success_rate']} success rate\n\n")
     
-    return report
+    for test in integration_tests['test_details']:
+        append(f"- **{test['test']}:** {test['status']} - {test['description']}\n")
+    
+    append("\n## Key Components\n\n")
+    append(f"- **Bedrock Agent ID:** {bedrock_agent['agent_id']}\n")
+    append(f"- **Agent Alias ID:** {bedrock_agent['alias_id']}\n")
+    append(f"- **Lambda Function:** {components['lambda_bridge']['function_name']}\n")
+    append(f"- **Gateway URL:** {components['agentcore_gateway']['url']}\n")
+    
+    append("\n## Usage Instructions\n\n")
+    append("### AWS Console Testing\n")
+    for i, step in enumerate(report['usage_instructions']['bedrock_console']['steps'], 1):
+        append(f"{step}\n")
+    
+    append("\n### Sample Interactions\n\n")
+    for interaction in report['sample_interactions']:
+        append(f"**User:** {interaction['user_query']}\n")
+        append(f"**Agent:** {interaction['agent_response']}\n\n")
+    
+    append("## Next Steps\n\n")
+    append("### Immediate Actions\n")
+    for step in report['next_steps']['immediate']:
+        append(f"- {step}\n")
+    
+    append("\n### Future Enhancements\n")
+    for enhancement in report['next_steps']['enhancements']:
+        append(f"- {enhancement}\n")
+    
+    append(f"\n## Cost Estimation\n\n")
+    append(f"**Estimated Monthly Cost:** {report['cost_estimation']['monthly_estimate']['total_estimated']}\n\n")
+    
+    append("---\n\n")
+    append("✅ **Deployment Status: SUCCESSFUL**\n")
+    append("🚀 **Ready for Testing and Usage**\n")
+    
+    return "".join(parts)
 
 def save_report():
     """Save the comprehensive report"""
     report = generate_comprehensive_report()
     
-    # Save as JSON
-    with open('comprehensive_test_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    def write_json():
+        Path('comprehensive_test_report.json').write_bytes(_json_bytes(report))
+    
+    def write_markdown():
+        Path('comprehensive_test_report.md').write_text(_build_markdown(report))
     
-    # Save as readable text
-    with open('comprehensive_test_report.md', 'w') as f:
-        f.write("# AgentCore Security Assessment Application - Deployment Report\n\n")
-        f.write(f"**Generated:** {report['deployment_summary']['deployment_date']}\n")
-        f.write(f"**Status:** {report['deployment_summary']['status']}\n")
-        f.write(f"**AWS Account:** {report['deployment_summary']['aws_account']}\n")
-        f.write(f"**Region:** {report['deployment_summary']['aws_region']}\n\n")
-        
-        f.write("## Architecture Overview\n\n")
-        f.write(f"{report['architecture']['description']}\n\n")
-        f.write(f"**Data Flow:** {report['architecture']['flow']}\n\n")
-        
-        f.write("## Deployment Results\n\n")
-        f.write(f"- **Success Rate:** {report['deployment_results']['success_rate']}\n")
-        f.write(f"- **Components Deployed:** {report['deployment_results']['successful_deployments']}/{report['deployment_results']['total_components']}\n")
-        f.write(f"- **Deployment Time:** {report['deployment_results']['deployment_time']}\n\n")
-        
-        f.write("### Component Status\n\n")
-        for component, status in report['deployment_results']['components_status'].items():
-            f.write(f"- **{component.replace('_', ' ').title()}:** {status}\n")
-        
-        f.write("\n## Test Results\n\n")
-        f.write(f"**Integration Tests:** {report['test_results']['integration_tests']['success_rate']} success rate\n\n")
-        
-        for test in report['test_results']['integration_tests']['test_details']:
-            f.write(f"- **{test['test']}:** {test['status']} - {test['description']}\n")
-        
-        f.write("\n## Key Components\n\n")
-        f.write(f"- **Bedrock Agent ID:** {report['architecture']['components']['bedrock_agent']['agent_id']}\n")
-        f.write(f"- **Agent Alias ID:** {report['architecture']['components']['bedrock_agent']['alias_id']}\n")
-        f.write(f"- **Lambda Function:** {report['architecture']['components']['lambda_bridge']['function_name']}\n")
-        f.write(f"- **Gateway URL:** {report['architecture']['components']['agentcore_gateway']['url']}\n")
-        
-        f.write("\n## Usage Instructions\n\n")
-        f.write("### AWS Console Testing\n")
-        for i, step in enumerate(report['usage_instructions']['bedrock_console']['steps'], 1):
-            f.write(f"{step}\n")
-        
-        f.write("\n### Sample Interactions\n\n")
-        for interaction in report['sample_interactions']:
-            f.write(f"**User:** {interaction['user_query']}\n")
-            f.write(f"**Agent:** {interaction['agent_response']}\n\n")
-        
-        f.write("## Next Steps\n\n")
-        f.write("### Immediate Actions\n")
-        for step in report['next_steps']['immediate']:
-            f.write(f"- {step}\n")
-        
-        f.write("\n### Future Enhancements\n")
-        for enhancement in report['next_steps']['enhancements']:
-            f.write(f"- {enhancement}\n")
-        
-        f.write(f"\n## Cost Estimation\n\n")
-        f.write(f"**Estimated Monthly Cost:** {report['cost_estimation']['monthly_estimate']['total_estimated']}\n\n")
-        
-        f.write("---\n\n")
-        f.write("✅ **Deployment Status: SUCCESSFUL**\n")
-        f.write("🚀 **Ready for Testing and Usage**\n")
+    # The JSON and Markdown files are independent, so render and write them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        writes = [executor.submit(write_json), executor.submit(write_markdown)]
+    for write in writes:
+        write.result()
     
     print("📊 Comprehensive test report generated!")
     print("📄 Files created:")
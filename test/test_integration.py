@@ -2,22 +2,91 @@
 Integration test for AgentCore Security Assessment Application
 """
 import boto3
+import contextvars
+import functools
+import io
 import json
 import os
+import sys
 import asyncio
 import httpx
+import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pytest_asyncio
+except ImportError:
+    pytest_asyncio = None
+
+def _dumps(obj):
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+def _loads(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# Default for events without a 'chunk' entry; never mutated
+_EMPTY = {}
+
+# OAuth tokens keyed by (client_id, scope): (token, expires_at on the time.monotonic() clock)
+_TOKEN_CACHE = {}
+
 def load_config(config_file):
     """Load configuration from JSON file"""
+    # Resolve first so the cache key does not depend on how the path was spelled
+    return _load_config(str(Path(config_file).resolve()))
+
+@functools.lru_cache(maxsize=None)
+def _load_config(path):
+    """Read and parse a configuration file once per process"""
     try:
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        data = Path(path).read_bytes()
     except FileNotFoundError:
-        print(f"❌ Configuration file not found: {config_file}")
+        print(f"❌ Configuration file not found: {path}")
         return None
+    return _loads(data)
+
+if pytest_asyncio is not None:
+    @pytest_asyncio.fixture
+    async def http_client():
+        """httpx client shared by a test's gateway calls, closed when the test ends"""
+        async with httpx.AsyncClient() as client:
+            yield client
 
-async def test_gateway_direct():
+async def _get_token(http_client, gateway_config):
+    """Get an OAuth token for the Gateway, reusing a cached one until shortly before it expires"""
+    key = (gateway_config['cognito_client_id'], gateway_config['cognito_scope'])
+    cached = _TOKEN_CACHE.get(key)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    
+    token_response = await http_client.post(
+        gateway_config['cognito_token_endpoint'],
+        data={
+            'grant_type': 'client_credentials',
+            'client_id': gateway_config['cognito_client_id'],
+            'client_secret': gateway_config['cognito_client_secret'],
+            'scope': gateway_config['cognito_scope']
+        },
+        headers={'Content-Type': 'application/x-www-form-urlencoded'}
+    )
+    
+    if token_response.status_code != 200:
+        print(f"❌ OAuth token request failed: {token_response.text}")
+        return None
+    
+    token_data = token_response.json()
+    token = token_data['access_token']
+    _TOKEN_CACHE[key] = (token, time.monotonic() + token_data.get('expires_in', 3600) - 30)
+    return token
+
+async def test_gateway_direct(http_client):
     """Test direct Gateway access with OAuth"""
     print("\n🧪 Testing AgentCore Gateway (Direct Access)")
     
@@ -26,54 +95,40 @@ async def test_gateway_direct():
         return False
     
     # Get OAuth token
-    async with httpx.AsyncClient() as client:
-        token_response = await client.post(
-            gateway_config['cognito_token_endpoint'],
-            data={
-                'grant_type': 'client_credentials',
-                'client_id': gateway_config['cognito_client_id'],
-                'client_secret': gateway_config['cognito_client_secret'],
-                'scope': gateway_config['cognito_scope']
-            },
-            headers={'Content-Type': 'application/x-www-form-urlencoded'}
-        )
-        
-        if token_response.status_code != 200:
-            print(f"❌ OAuth token request failed: {token_response.text}")
-            return False
-        
-        token = token_response.json()['access_token']
-        print("✅ OAuth token obtained")
-        
-        # Test security services check
-        gateway_response = await client.post(
-            gateway_config['gateway_url'],
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": "check_security_services",
-                    "arguments": {}
-                }
+    token = await _get_token(http_client, gateway_config)
+    if not token:
+        return False
+    print("✅ OAuth token obtained")
+    
+    # Test security services check
+    gateway_response = await http_client.post(
+        gateway_config['gateway_url'],
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        },
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {
+                "name": "check_security_services",
+                "arguments": {}
             }
-        )
-        
-        if gateway_response.status_code == 200:
-            result = gateway_response.json()
-            if 'result' in result:
-                print("✅ Gateway security services check successful")
-                return True
-            else:
-                print(f"❌ Gateway returned error: {result}")
-                return False
+        }
+    )
+    
+    if gateway_response.status_code == 200:
+        result = gateway_response.json()
+        if 'result' in result:
+            print("✅ Gateway security services check successful")
+            return True
         else:
-            print(f"❌ Gateway request failed: {gateway_response.status_code}")
+            print(f"❌ Gateway returned error: {result}")
             return False
+    else:
+        print(f"❌ Gateway request failed: {gateway_response.status_code}")
+        return False
 
 def test_bedrock_agent():
     """Test Bedrock Agent invocation"""
@@ -84,7 +139,8 @@ def test_bedrock_agent():
         return False
     
     region = os.getenv('AWS_REGION', 'us-east-1')
-    bedrock_runtime = boto3.client('bedrock-agent-runtime', region_name=region)
+    # Own session: the tests run concurrently and a boto3 session is not thread-safe
+    bedrock_runtime = boto3.session.Session().client('bedrock-agent-runtime', region_name=region)
     
     try:
         # Test agent invocation
@@ -97,13 +153,15 @@ def test_bedrock_agent():
         
         # Process streaming response
         event_stream = response['completion']
-        full_response = ""
+        chunks = []
         
         for event in event_stream:
-            if 'chunk' in event:
-                chunk = event['chunk']
-                if 'bytes' in chunk:
-                    full_response += chunk['bytes'].decode('utf-8')
+            data = event.get('chunk', _EMPTY).get('bytes')
+            if data:
+                chunks.append(data)
+        
+        # Decode once; a multi-byte character may be split across chunks
+        full_response = b"".join(chunks).decode('utf-8')
         
         if full_response:
             print("✅ Bedrock Agent responded successfully")
@@ -126,7 +184,8 @@ def test_lambda_bridge():
         return False
     
     region = os.getenv('AWS_REGION', 'us-east-1')
-    lambda_client = boto3.client('lambda', region_name=region)
+    # Own session: the tests run concurrently and a boto3 session is not thread-safe
+    lambda_client = boto3.session.Session().client('lambda', region_name=region)
     
     try:
         # Test Lambda function
@@ -138,10 +197,10 @@ def test_lambda_bridge():
         
         response = lambda_client.invoke(
             FunctionName=lambda_config['function_name'],
-            Payload=json.dumps(test_event)
+            Payload=_dumps(test_event)
         )
         
-        result = json.loads(response['Payload'].read())
+        result = _loads(response['Payload'].read())
         
         if 'functionResponse' in result:
             print("✅ Lambda bridge function working")
@@ -184,30 +243,68 @@ def test_memory_integration():
         print(f"❌ Memory test failed: {str(e)}")
         return False
 
+# Output buffer of the test running in the current context, while
+# run_integration_tests runs them concurrently
+_OUTPUT = contextvars.ContextVar('_OUTPUT', default=None)
+
+class _RoutedStdout:
+    """sys.stdout stand-in that writes to the current test's buffer, if it has one"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        return (_OUTPUT.get() or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+async def _run_captured(test_func):
+    """Run one test with its output buffered, returning (outcome, output)"""
+    # Each gathered task has its own context, and to_thread carries it into the worker
+    buf = io.StringIO()
+    _OUTPUT.set(buf)
+    try:
+        if asyncio.iscoroutinefunction(test_func):
+            outcome = await test_func()
+        else:
+            outcome = await asyncio.to_thread(test_func)
+    except Exception as e:
+        outcome = e
+    return outcome, buf.getvalue()
+
 async def run_integration_tests():
     """Run all integration tests"""
     print("🚀 Starting AgentCore Security Assessment Integration Tests")
     print("="*60)
     
-    tests = [
-        ("Memory Integration", test_memory_integration),
-        ("Gateway Direct Access", test_gateway_direct),
-        ("Lambda Bridge", test_lambda_bridge),
-        ("Bedrock Agent", test_bedrock_agent)
-    ]
+    # The tests probe independent services, so run them concurrently;
+    # blocking (boto3) tests run in worker threads. Output is buffered per
+    # test and printed in order afterwards, so progress lines do not interleave
+    async with httpx.AsyncClient() as http_client:
+        tests = [
+            ("Memory Integration", test_memory_integration),
+            ("Gateway Direct Access", functools.partial(test_gateway_direct, http_client)),
+            ("Lambda Bridge", test_lambda_bridge),
+            ("Bedrock Agent", test_bedrock_agent)
+        ]
+        
+        stdout = sys.stdout
+        sys.stdout = _RoutedStdout(stdout)
+        try:
+            runs = await asyncio.gather(*(_run_captured(test_func) for _, test_func in tests))
+        finally:
+            sys.stdout = stdout
     
     results = {}
     
-    for test_name, test_func in tests:
-        try:
-            if asyncio.iscoroutinefunction(test_func):
-                result = await test_func()
-            else:
-                result = test_func()
-            results[test_name] = result
-        except Exception as e:
-            print(f"❌ {test_name} test failed with exception: {str(e)}")
+    for (test_name, _), (outcome, output) in zip(tests, runs):
+        print(output, end='')
+        if isinstance(outcome, Exception):
+            print(f"❌ {test_name} test failed with exception: {str(outcome)}")
             results[test_name] = False
+        else:
+            results[test_name] = outcome
     
     # Summary
     print("\n" + "="*60)
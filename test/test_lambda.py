@@ -2,6 +2,19 @@
 import boto3
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj):
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+def _loads(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 def test_lambda():
     lambda_client = boto3.client('lambda', region_name='us-east-1')
     
@@ -15,10 +28,11 @@ def test_lambda():
     
     response = lambda_client.invoke(
         FunctionName='security-agent-bridge',
-        Payload=json.dumps(test_event)
+        Payload=_dumps(test_event)
     )
     
-    result = json.loads(response['Payload'].read())
+    payload = response['Payload'].read()
+    result = _loads(payload)
     print("Lambda Response:")
     print(json.dumps(result, indent=2))
 
@@ -1,10 +1,28 @@
 #!/usr/bin/env python3
 import boto3
 import uuid
-import time
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+
+# Default for events without a 'chunk' entry; never mutated
+_EMPTY = {}
+
+# Built on first use and shared, so repeated calls reuse the client and its connection pool
+_RUNTIME = None
+
+def _runtime():
+    global _RUNTIME
+    if _RUNTIME is None:
+        # Adaptive retries back off only when Bedrock actually throttles
+        _RUNTIME = boto3.client(
+            'bedrock-agent-runtime',
+            region_name='us-east-1',
+            config=Config(retries={'mode': 'adaptive', 'max_attempts': 5})
+        )
+    return _RUNTIME
 
 def test_security_queries():
-    bedrock_runtime = boto3.client('bedrock-agent-runtime', region_name='us-east-1')
+    bedrock_runtime = _runtime()
     agent_id = "KS91Z9H2MA"
     agent_alias_id = "UEWYRHGIEL"
     
@@ -14,33 +32,37 @@ def test_security_queries():
         "Analyze my overall security posture and provide recommendations"
     ]
     
-    for i, query in enumerate(queries, 1):
+    def run_query(query):
+        session_id = uuid.uuid4().hex
+        response = bedrock_runtime.invoke_agent(
+            agentId=agent_id,
+            agentAliasId=agent_alias_id,
+            sessionId=session_id,
+            inputText=query
+        )
+        
+        chunks = []
+        for event in response['completion']:
+            data = event.get('chunk', _EMPTY).get('bytes')
+            if data:
+                chunks.append(data)
+        return b"".join(chunks).decode('utf-8')
+    
+    # Each query uses its own session, so invoke them all concurrently
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        futures = [executor.submit(run_query, query) for query in queries]
+    
+    for i, (query, future) in enumerate(zip(queries, futures), 1):
         print(f"\n{'='*60}")
         print(f"Query {i}: {query}")
         print('='*60)
         
         try:
-            session_id = str(uuid.uuid4())
-            response = bedrock_runtime.invoke_agent(
-                agentId=agent_id,
-                agentAliasId=agent_alias_id,
-                sessionId=session_id,
-                inputText=query
-            )
-            
-            response_text = ""
-            for event in response['completion']:
-                if 'chunk' in event:
-                    chunk = event['chunk']
-                    if 'bytes' in chunk:
-                        response_text += chunk['bytes'].decode('utf-8')
-            
+            response_text = future.result()
             print(f"Response:\n{response_text}")
             
         except Exception as e:
             print(f"Error: {e}")
-        
-        time.sleep(2)
 
 if __name__ == "__main__":
     test_security_queries()
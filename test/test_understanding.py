@@ -2,8 +2,20 @@
 import boto3
 import uuid
 
+# Default for events without a 'chunk' entry; never mutated
+_EMPTY = {}
+
+# Built on first use and shared, so repeated calls reuse the client and its connection pool
+_RUNTIME = None
+
+def _runtime():
+    global _RUNTIME
+    if _RUNTIME is None:
+        _RUNTIME = boto3.client('bedrock-agent-runtime', region_name='us-east-1')
+    return _RUNTIME
+
 def test_understanding():
-    bedrock_runtime = boto3.client('bedrock-agent-runtime', region_name='us-east-1')
+    bedrock_runtime = _runtime()
     agent_id = "KS91Z9H2MA"
     agent_alias_id = "UEWYRHGIEL"
     
@@ -14,7 +26,7 @@ def test_understanding():
     print('='*70)
     
     try:
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
         response = bedrock_runtime.invoke_agent(
             agentId=agent_id,
             agentAliasId=agent_alias_id,
@@ -22,12 +34,12 @@ def test_understanding():
             inputText=query
         )
         
-        response_text = ""
+        chunks = []
         for event in response['completion']:
-            if 'chunk' in event:
-                chunk = event['chunk']
-                if 'bytes' in chunk:
-                    response_text += chunk['bytes'].decode('utf-8')
+            data = event.get('chunk', _EMPTY).get('bytes')
+            if data:
+                chunks.append(data)
+        response_text = b"".join(chunks).decode('utf-8')
         
         print(f"Response:\n{response_text}")
         